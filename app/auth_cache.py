@@ -0,0 +1,49 @@
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+
+from app import metrics, models
+from app.cache import LRUCache
+from app.config import AUTH_CACHE_SIZE, AUTH_CACHE_TTL_SECONDS
+from app.unit_of_work import on_commit
+
+
+class UserSnapshot:
+    """Detached copy of the User columns needed by request handlers."""
+
+    __slots__ = ("id", "email", "first_name", "last_name")
+
+    def __init__(self, id: str, email: str, first_name=None, last_name=None):
+        self.id = id
+        self.email = email
+        self.first_name = first_name
+        self.last_name = last_name
+
+    @classmethod
+    def from_user(cls, user: models.User):
+        return cls(user.id, user.email, user.first_name, user.last_name)
+
+
+# token -> user id, kept no longer than the token's own "exp"
+token_cache = LRUCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+# user id -> UserSnapshot
+user_cache = LRUCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+
+
+def invalidate_user(user_id: str):
+    user_cache.delete(user_id)
+    token_cache.delete_where(lambda token, cached_user_id: cached_user_id == user_id)
+
+
+@event.listens_for(models.User, "after_update")
+@event.listens_for(models.User, "after_delete")
+def _user_changed(mapper, connection, target):
+    # evicting at flush time would let a concurrent request cache the old row again before the commit
+    session = object_session(target)
+    if session is None:
+        invalidate_user(target.id)
+        return
+    user_id = target.id
+    on_commit(session, lambda: invalidate_user(user_id))
+
+
+metrics.register("auth_cache", lambda: {"tokens": token_cache.stats(), "users": user_cache.stats()})
@@ -0,0 +1,29 @@
+from fastapi import Request, Response
+
+
+# revalidate every time, but let the browser keep the body and send If-None-Match
+CACHE_CONTROL = "private, no-cache"
+
+
+def project_etag(project, *parts) -> str:
+    # extra parts for responses that also depend on something besides the project's rows
+    return 'W/"' + ".".join([project.id, str(project.version), *map(str, parts)]) + '"'
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # weak comparison, as RFC 9110 requires for If-None-Match
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag))
@@ -8,3 +8,60 @@ DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://postgres:postgres@db:5432
 SECRET_KEY = os.getenv("SECRET_KEY", "devsecret")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "1024"))
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+
+# Serve requests on an AsyncEngine/AsyncSession (asyncpg, or aiosqlite for local runs)
+DATABASE_ASYNC = os.getenv("DATABASE_ASYNC", "false").lower() in ("1", "true", "yes")
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+# Connection pool (ignored for in-memory SQLite)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+# Per-statement timeout enforced by Postgres; 0 disables it
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
+# Read replicas, comma-separated; GET requests are spread over them, everything else uses DATABASE_URL
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# reads from a client whose X-Last-Write marker is younger than this stay on the primary, so it sees its own changes
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+
+# Create a fresh schema or apply pending migrations when the app starts
+DB_AUTO_MIGRATE = os.getenv("DB_AUTO_MIGRATE", "true").lower() in ("1", "true", "yes")
+
+# Projects whose computed reverse schedule is kept in memory
+SCHEDULE_CACHE_SIZE = int(os.getenv("SCHEDULE_CACHE_SIZE", "256"))
+
+# Largest batch accepted by the bulk task endpoints
+BULK_TASKS_MAX = int(os.getenv("BULK_TASKS_MAX", "10000"))
+BULK_INVITATIONS_MAX = int(os.getenv("BULK_INVITATIONS_MAX", "1000"))
+
+# GET /search: words taken from the query and the deepest offset a cursor may reach
+SEARCH_MAX_TERMS = int(os.getenv("SEARCH_MAX_TERMS", "8"))
+SEARCH_MAX_OFFSET = int(os.getenv("SEARCH_MAX_OFFSET", "1000"))
+
+# Project change feed: "memory" (single process) or "redis" (pub/sub fan-out across workers)
+EVENTS_BACKEND = os.getenv("EVENTS_BACKEND", "memory")
+EVENTS_REDIS_URL = os.getenv("EVENTS_REDIS_URL", "redis://localhost:6379/0")
+EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "1000"))
+EVENTS_KEEPALIVE_SECONDS = float(os.getenv("EVENTS_KEEPALIVE_SECONDS", "15"))
+# open streams re-check token and project access this often (and right after member.removed)
+EVENTS_ACCESS_RECHECK_SECONDS = float(os.getenv("EVENTS_ACCESS_RECHECK_SECONDS", "60"))
+
+# bcrypt runs in a separate process pool; beyond HASH_MAX_PENDING in-flight jobs auth requests get 503
+HASH_POOL_SIZE = int(os.getenv("HASH_POOL_SIZE", "2"))
+HASH_MAX_PENDING = int(os.getenv("HASH_MAX_PENDING", "16"))
+
+# Background job marking past-deadline open tasks as Overdue; interval 0 disables it
+OVERDUE_SWEEP_INTERVAL_SECONDS = float(os.getenv("OVERDUE_SWEEP_INTERVAL_SECONDS", "60"))
+OVERDUE_SWEEP_BATCH_SIZE = int(os.getenv("OVERDUE_SWEEP_BATCH_SIZE", "500"))
+# a run stops starting new batches after this long; the rest is picked up next time
+OVERDUE_SWEEP_MAX_SECONDS = float(os.getenv("OVERDUE_SWEEP_MAX_SECONDS", "5"))
+
+# GET /metrics exposes pool, cache and queue internals; only callers sending this bearer token get them.
+# Unset, the endpoint answers 404.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
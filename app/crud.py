@@ -1,49 +1,248 @@
-from sqlalchemy.orm import Session, joinedload
-from app import models
-from passlib.context import CryptContext
+from sqlalchemy import or_, and_, select, literal, func, update, insert, delete, exists, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload
+from app import events, models, serializers
+from app.models.task import OPEN_TASK_STATUSES, TaskStatusEnum
+from app.services.schedule_service import epoch_seconds, schedule_service, to_epoch
+from app.unit_of_work import on_commit
+from collections import Counter
 from datetime import datetime
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Users
 def get_user_by_email(db: Session, email: str):
     return db.query(models.User).filter(models.User.email == email).first()
 
+def get_user_credentials(db: Session, email: str):
+    """(id, hashed_password) or None."""
+    row = db.query(models.User.id, models.User.hashed_password).filter(models.User.email == email).first()
+    return tuple(row) if row else None
+
+def get_user_ids_by_email(db: Session, emails) -> dict:
+    # one IN query for a batch of emails; unknown emails are simply missing from the result
+    emails = list(emails)
+    if not emails:
+        return {}
+    rows = db.execute(select(models.User.email, models.User.id).where(models.User.email.in_(emails)))
+    return dict(rows.all())
+
 def get_user(db: Session, user_id: str):
     return db.query(models.User).get(user_id)
 
-def create_user(db: Session, email: str, password: str, first_name=None, last_name=None):
-    hashed = pwd_context.hash(password)
-    user = models.User(email=email, hashed_password=hashed, first_name=first_name, last_name=last_name)
+def create_user(db: Session, email: str, hashed_password: str, first_name=None, last_name=None):
+    # hash with app.hashing first; bcrypt does not run on request threads
+    user = models.User(email=email, hashed_password=hashed_password, first_name=first_name, last_name=last_name)
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()
     return user
 
-def verify_password(plain, hashed):
-    return pwd_context.verify(plain, hashed)
-
 
 def create_project(db: Session, name: str, owner_id: str = None, final_deadline=None):
     project = models.Project(name=name, owner_id=owner_id, final_deadline=final_deadline)
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    db.flush()
+    return project
 
-    return (
-        db.query(models.Project)
-        .options(joinedload(models.Project.owner))
-        .filter(models.Project.id == project.id)
-        .first()
+def get_project(db: Session, project_id: str):
+    # Session.get answers from the identity map when the row is already loaded
+    return db.get(models.Project, project_id, options=[joinedload(models.Project.owner)])
+
+def bump_project_version(db: Session, *project_ids) -> dict:
+    """Atomically increment the version of each project; returns {project_id: new version}.
+
+    Runs in the caller's transaction, so concurrent writers to one project are
+    serialized on its row and versions are handed out in commit order. ETags
+    and the delta sync cursor are both this counter.
+    """
+    ids = {project_id for project_id in project_ids if project_id}
+    if not ids:
+        return {}
+    rows = db.execute(
+        update(models.Project)
+        .where(models.Project.id.in_(ids))
+        .values(version=models.Project.version + 1)
+        .returning(models.Project.id, models.Project.version)
+        .execution_options(synchronize_session=False)
+    )
+    return dict(rows.all())
+
+def add_task_tombstones(db: Session, project_id: str, version: int, task_ids):
+    # task_ids is a list or a SELECT of ids (e.g. a subtree); written set-based
+    if isinstance(task_ids, list):
+        task_ids = select(models.Task.id).where(models.Task.id.in_(task_ids))
+    db.execute(
+        insert(models.TaskTombstone).from_select(
+            ["project_id", "task_id", "version"],
+            select(literal(project_id), task_ids.subquery().c.id, literal(version)),
+        )
     )
 
-def get_project(db: Session, project_id: str):
-    return (
-        db.query(models.Project)
-        .options(joinedload(models.Project.owner))
-        .filter(models.Project.id == project_id)
-        .first()
+# Task summaries
+def task_summary_key(project_id: str, status, assigned_to_id: str):
+    return (project_id, TaskStatusEnum(status or TaskStatusEnum.New), assigned_to_id or "")
+
+def count_task_summary(db: Session, task_ids) -> Counter:
+    """Summary keys of the given tasks (a list or a SELECT of ids) with their counts, in one GROUP BY."""
+    rows = db.execute(
+        select(models.Task.project_id, models.Task.status, models.Task.assigned_to_id, func.count())
+        .where(models.Task.id.in_(task_ids))
+        .group_by(models.Task.project_id, models.Task.status, models.Task.assigned_to_id)
+    )
+    counts = Counter()
+    for project_id, status, assigned_to_id, count in rows:
+        counts[task_summary_key(project_id, status, assigned_to_id)] += count
+    return counts
+
+def adjust_task_summary(db: Session, added=(), removed=()):
+    """Apply task count deltas to the summary table with one upsert; ``added``/``removed`` are keys or Counters."""
+    delta = Counter(added)
+    delta.subtract(removed)
+    values = [
+        {"project_id": project_id, "status": status, "assignee_id": assignee_id, "task_count": count}
+        for (project_id, status, assignee_id), count in delta.items()
+        if project_id and count
+    ]
+    if not values:
+        return
+    dialect_insert = sqlite.insert if db.get_bind().dialect.name == "sqlite" else postgresql.insert
+    summary = models.ProjectTaskSummary.__table__
+    stmt = dialect_insert(summary).values(values)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[summary.c.project_id, summary.c.status, summary.c.assignee_id],
+        set_={"task_count": summary.c.task_count + stmt.excluded.task_count},
+    ))
+
+def task_summary_counts(project_id: str = None):
+    """SELECT of (project_id, status, assignee_id, count) straight from the tasks table."""
+    status = func.coalesce(models.Task.status, TaskStatusEnum.New)
+    assignee_id = func.coalesce(models.Task.assigned_to_id, "")
+    stmt = (
+        select(models.Task.project_id, status, assignee_id, func.count())
+        .where(models.Task.project_id.is_not(None))
+        .group_by(models.Task.project_id, status, assignee_id)
     )
+    if project_id:
+        stmt = stmt.where(models.Task.project_id == project_id)
+    return stmt
+
+def recompute_task_summary(db: Session, project_id: str = None):
+    """Rebuild summary rows with a single GROUP BY over tasks (one project, or all of them)."""
+    clear = delete(models.ProjectTaskSummary)
+    if project_id:
+        clear = clear.where(models.ProjectTaskSummary.project_id == project_id)
+    db.execute(clear)
+    db.execute(
+        insert(models.ProjectTaskSummary).from_select(
+            ["project_id", "status", "assignee_id", "task_count"], task_summary_counts(project_id)
+        )
+    )
+
+def get_task_summary(db: Session, project_id: str, week_start: datetime, week_end: datetime) -> dict:
+    rows = db.execute(
+        select(
+            models.ProjectTaskSummary.status,
+            models.ProjectTaskSummary.assignee_id,
+            models.ProjectTaskSummary.task_count,
+        ).where(models.ProjectTaskSummary.project_id == project_id, models.ProjectTaskSummary.task_count > 0)
+    ).all()
+    due_this_week = db.execute(
+        select(func.count())
+        .select_from(models.Task)
+        .where(
+            models.Task.project_id == project_id,
+            models.Task.deadline >= week_start,
+            models.Task.deadline < week_end,
+            models.Task.status != TaskStatusEnum.Completed,
+        )
+    ).scalar()
+
+    by_status = dict.fromkeys((status.value for status in TaskStatusEnum), 0)
+    workload = {}
+    for status, assignee_id, count in rows:
+        by_status[status.value] += count
+        entry = workload.setdefault(assignee_id, {"total": 0, "open": 0, "by_status": {}})
+        entry["total"] += count
+        entry["by_status"][status.value] = count
+        if status != TaskStatusEnum.Completed:
+            entry["open"] += count
+    assignee_ids = [assignee_id for assignee_id in workload if assignee_id]
+    users = {}
+    if assignee_ids:
+        users = {user.id: user for user in db.query(models.User).filter(models.User.id.in_(assignee_ids))}
+    return {
+        "project_id": project_id,
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+        "due_this_week": due_this_week,
+        "week_start": week_start,
+        "week_end": week_end,
+        "workload": sorted(
+            ({"user": users.get(assignee_id), **entry} for assignee_id, entry in workload.items()),
+            key=lambda entry: -entry["open"],
+        ),
+    }
+
+# timeline status codes are indexes into this list, which the payload also carries
+TIMELINE_STATUSES = list(TaskStatusEnum)
+
+def get_task_timeline(db: Session, project_id: str, window_start: datetime, window_end: datetime) -> dict:
+    """Tasks whose span overlaps the window, as parallel arrays.
+
+    The span runs between created_at and deadline in whichever order they
+    come (a task may be created with a past deadline, so ``end`` can precede
+    ``start``); a task without a deadline is a point at created_at. ``parent``
+    is an index into the arrays, -1 for a root task and -2 when the parent
+    lies outside the window; ``assignee`` indexes ``assignees`` (-1 for
+    unassigned).
+    """
+    task = models.Task
+    # [least(created_at, deadline), greatest(...)] overlaps the window; split by
+    # where the deadline falls, each branch is one range on ix_tasks_project_timeline
+    # (as a single OR the planner falls back to scanning the whole project)
+    branches = (
+        task.deadline.between(window_start, window_end),
+        and_(task.deadline > window_end, task.created_at <= window_end),
+        and_(task.deadline < window_start, task.created_at >= window_start),
+        and_(task.deadline.is_(None), task.created_at.between(window_start, window_end)),
+    )
+    hits = union_all(*(
+        select(
+            task.id, task.name, task.status, task.parent_task_id, task.assigned_to_id, task.created_at,
+            epoch_seconds(db, task.created_at).label("start"), epoch_seconds(db, task.deadline).label("end"),
+        ).where(task.project_id == project_id, branch)
+        for branch in branches
+    )).subquery()
+    rows = db.execute(
+        select(
+            hits.c.id, hits.c.name, hits.c.status, hits.c.parent_task_id, hits.c.assigned_to_id,
+            hits.c.start, hits.c.end,
+        ).order_by(hits.c.created_at, hits.c.id)
+    ).all()
+
+    index = {row[0]: position for position, row in enumerate(rows)}
+    status_codes = {status: code for code, status in enumerate(TIMELINE_STATUSES)}
+    assignee_index = {}
+    for row in rows:
+        if row[4] is not None and row[4] not in assignee_index:
+            assignee_index[row[4]] = len(assignee_index)
+    assignees = [None] * len(assignee_index)
+    if assignee_index:
+        for user in db.execute(select(*ASSIGNEE_COLUMNS).where(models.User.id.in_(list(assignee_index)))):
+            assignees[assignee_index[user.id]] = dict(user._mapping)
+    return {
+        "project_id": project_id,
+        "from": round(to_epoch(window_start)),
+        "to": round(to_epoch(window_end)),
+        "statuses": [status.value for status in TIMELINE_STATUSES],
+        "ids": [row[0] for row in rows],
+        "names": [row[1] for row in rows],
+        "start": [None if row[5] is None else round(row[5]) for row in rows],
+        "end": [None if row[6] is None else round(row[6]) for row in rows],
+        "status": [status_codes.get(row[2] or TaskStatusEnum.New) for row in rows],
+        "parent": [-1 if row[3] is None else index.get(row[3], -2) for row in rows],
+        "assignee": [-1 if row[4] is None else assignee_index[row[4]] for row in rows],
+        "assignees": assignees,
+    }
 
 def edit_project(db: Session, project_id: str, name: str = None, final_deadline = None):
     project = get_project(db, project_id)
@@ -53,14 +252,20 @@ def edit_project(db: Session, project_id: str, name: str = None, final_deadline
         project.name = name
     if final_deadline:
         project.final_deadline = final_deadline
-    db.commit()
+    bump_project_version(db, project_id)
+    events.emit(db, project_id, "project.updated", lambda: {"project": serializers.project(project)})
+    db.flush()
     return project
 
 def delete_project(db: Session, project_id: str):
     project = get_project(db, project_id)
     if project:
+        db.execute(delete(models.TaskTombstone).where(models.TaskTombstone.project_id == project_id))
+        db.execute(delete(models.ProjectTaskSummary).where(models.ProjectTaskSummary.project_id == project_id))
         db.delete(project)
-        db.commit()
+        events.emit(db, project_id, "project.deleted", {})
+        db.flush()
+        forget_project_access(db, project_id)
         return True
     return False
 
@@ -72,6 +277,30 @@ def list_projects(db: Session):
         .all()
     )
 
+def list_projects_for_user(db: Session, user_id: str, limit: int = None, after=None):
+    # "owned OR member" in one query; keyset pagination on (created_at, id) desc
+    member_project_ids = (
+        db.query(models.ProjectMembership.project_id)
+        .filter(models.ProjectMembership.user_id == user_id)
+    )
+    query = (
+        db.query(models.Project)
+        .options(joinedload(models.Project.owner))
+        .filter(or_(models.Project.owner_id == user_id, models.Project.id.in_(member_project_ids)))
+    )
+    if after:
+        after_created_at, after_id = after
+        query = query.filter(
+            or_(
+                models.Project.created_at < after_created_at,
+                and_(models.Project.created_at == after_created_at, models.Project.id < after_id),
+            )
+        )
+    query = query.order_by(models.Project.created_at.desc(), models.Project.id.desc())
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
 def list_members_by_project(db: Session, project_id: str):
     return (
         db.query(models.ProjectMembership)
@@ -85,18 +314,32 @@ def list_members_by_project(db: Session, project_id: str):
 def add_member(db: Session, project_id: str, user_id: str, role: str = "member"):
     membership = models.ProjectMembership(project_id=project_id, user_id=user_id, role=role)
     db.add(membership)
-    db.commit()
-    db.refresh(membership)
+    # flush first: a duplicate membership fails here, before the event is queued
+    db.flush()
+    bump_project_version(db, project_id)
+    events.emit(db, project_id, "member.added", lambda: {"membership": serializers.membership(membership)})
+    forget_project_access(db, project_id)
     return membership
 
+def list_member_user_ids(db: Session, project_id: str, user_ids=None):
+    # user_ids narrows the lookup to the given candidates instead of the whole member list
+    stmt = select(models.ProjectMembership.user_id).where(models.ProjectMembership.project_id == project_id)
+    if user_ids is not None:
+        stmt = stmt.where(models.ProjectMembership.user_id.in_(list(user_ids)))
+    return set(db.execute(stmt).scalars())
+
 def get_membership(db: Session, project_id: str, user_id: str):
     return db.query(models.ProjectMembership).filter_by(project_id=project_id, user_id=user_id).first()
 
 def remove_membership(db: Session, membership_id: str):
     mem = db.query(models.ProjectMembership).get(membership_id)
     if mem:
+        project_id = mem.project_id
         db.delete(mem)
-        db.commit()
+        bump_project_version(db, project_id)
+        events.emit(db, project_id, "member.removed", {"id": membership_id})
+        db.flush()
+        forget_project_access(db, project_id)
         return True
     return False
 
@@ -104,7 +347,9 @@ def set_membership_role(db: Session, membership_id: str, new_role: str):
     mem = db.query(models.ProjectMembership).get(membership_id)
     if mem:
         mem.role = new_role
-        db.commit()
+        bump_project_version(db, mem.project_id)
+        events.emit(db, mem.project_id, "member.updated", lambda: {"membership": serializers.membership(mem)})
+        db.flush()
         return mem
     return None
 
@@ -112,10 +357,92 @@ def set_membership_role(db: Session, membership_id: str, new_role: str):
 def create_task(db: Session, **kwargs):
     task = models.Task(**kwargs)
     db.add(task)
-    db.commit()
-    db.refresh(task)
+    task.change_version = bump_project_version(db, task.project_id).get(task.project_id, 0)
+    adjust_task_summary(db, [task_summary_key(task.project_id, task.status, task.assigned_to_id)])
+    events.emit(db, task.project_id, "task.created", lambda: {"tasks": [serializers.task(task)]})
+    db.flush()
     return task
 
+def bulk_insert_tasks(db: Session, project_id: str, rows: list):
+    # rows must list parents before their children; one executemany INSERT
+    version = bump_project_version(db, project_id)[project_id]
+    for row in rows:
+        row["change_version"] = version
+    db.bulk_insert_mappings(models.Task, rows)
+    adjust_task_summary(db, [
+        task_summary_key(project_id, row.get("status"), row.get("assigned_to_id")) for row in rows
+    ])
+    events.emit(db, project_id, "task.created", {"tasks": rows})
+    on_commit(db, lambda: schedule_service.invalidate(project_id))
+
+def bulk_update_tasks(db: Session, project_id: str, rows: list):
+    # rows are {"id": ..., <changed columns>}; executemany UPDATE by primary key
+    version = bump_project_version(db, project_id)[project_id]
+    for row in rows:
+        row["change_version"] = version
+    # summary deltas only for rows whose status or assignee may change: counted before and after
+    counted_ids = [row["id"] for row in rows if "status" in row or "assigned_to_id" in row]
+    before = count_task_summary(db, counted_ids) if counted_ids else Counter()
+    db.bulk_update_mappings(models.Task, rows)
+    if counted_ids:
+        adjust_task_summary(db, count_task_summary(db, counted_ids), before)
+    events.emit(db, project_id, "task.updated", {"tasks": rows})
+    on_commit(db, lambda: schedule_service.invalidate(project_id))
+
+def mark_overdue_tasks(db: Session, now: datetime, limit: int) -> int:
+    """Flip up to ``limit`` open tasks whose deadline has passed to Overdue; returns the row count.
+
+    Four set-based statements per batch: the locking SELECT of due rows (the
+    ``(status, deadline)`` index finds them), one version bump for every
+    touched project, one UPDATE setting status and ``change_version``, and
+    the summary upsert.
+    """
+    rows = db.execute(
+        select(models.Task.id, models.Task.project_id, models.Task.status, models.Task.assigned_to_id)
+        .where(models.Task.status.in_(OPEN_TASK_STATUSES), models.Task.deadline < now)
+        .limit(limit)
+        # a second sweeper (another worker) skips these rows instead of waiting on them
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not rows:
+        return 0
+    by_project = {}
+    for row in rows:
+        by_project.setdefault(row.project_id, []).append(row.id)
+    versions = bump_project_version(db, *by_project)
+    project_version = select(models.Project.version).where(models.Project.id == models.Task.project_id)
+    db.execute(
+        update(models.Task)
+        .where(models.Task.id.in_([row.id for row in rows]))
+        .values(status=TaskStatusEnum.Overdue, change_version=func.coalesce(project_version.scalar_subquery(), models.Task.change_version))
+        .execution_options(synchronize_session=False)
+    )
+    adjust_task_summary(
+        db,
+        [task_summary_key(row.project_id, TaskStatusEnum.Overdue, row.assigned_to_id) for row in rows],
+        [task_summary_key(row.project_id, row.status, row.assigned_to_id) for row in rows],
+    )
+    for project_id, version in versions.items():
+        events.emit(db, project_id, "task.updated", {"tasks": [
+            {"id": task_id, "status": TaskStatusEnum.Overdue, "change_version": version}
+            for task_id in by_project[project_id]
+        ]})
+    return len(rows)
+
+def get_task_rows(db: Session, project_id: str, task_ids):
+    # id -> (assigned_to_id, parent_task_id) for the given ids that belong to the project
+    rows = db.execute(
+        select(models.Task.id, models.Task.assigned_to_id, models.Task.parent_task_id)
+        .where(models.Task.project_id == project_id, models.Task.id.in_(list(task_ids)))
+    )
+    return {task_id: (assigned_to_id, parent_task_id) for task_id, assigned_to_id, parent_task_id in rows}
+
+def get_project_parent_map(db: Session, project_id: str):
+    rows = db.execute(
+        select(models.Task.id, models.Task.parent_task_id).where(models.Task.project_id == project_id)
+    )
+    return dict(rows.all())
+
 def get_task(db: Session, task_id: str):
     return db.query(models.Task).get(task_id)
 
@@ -123,53 +450,306 @@ def edit_task(db: Session, task_id: str, **kwargs):
     task = get_task(db, task_id)
     if not task:
         return None
+    old_project_id = task.project_id
+    old_key = task_summary_key(task.project_id, task.status, task.assigned_to_id)
     for k, v in kwargs.items():
         setattr(task, k, v)
-    db.commit()
+    versions = bump_project_version(db, old_project_id, task.project_id)
+    new_key = task_summary_key(task.project_id, task.status, task.assigned_to_id)
+    if new_key != old_key:
+        adjust_task_summary(db, [new_key], [old_key])
+    task.change_version = versions.get(task.project_id, 0)
+    if old_project_id and task.project_id != old_project_id:
+        add_task_tombstones(db, old_project_id, versions[old_project_id], [task_id])
+    if task.project_id == old_project_id:
+        events.emit(db, task.project_id, "task.updated", lambda: {"tasks": [serializers.task(task)]})
+    else:
+        events.emit(db, old_project_id, "task.deleted", {"ids": [task_id]})
+        events.emit(db, task.project_id, "task.created", lambda: {"tasks": [serializers.task(task)]})
+    db.flush()
     return task
 
 def delete_task(db: Session, task_id: str):
+    # set-based: one DELETE per table for the whole subtree instead of ORM cascade loading
     task = get_task(db, task_id)
-    if task:
-        db.delete(task)
-        db.commit()
-        return True
-    return False
+    if not task:
+        return False
+    project_id = task.project_id
+    subtree_ids = select(subtree_cte(task_id).c.id)
+    versions = bump_project_version(db, project_id)
+    if project_id:
+        add_task_tombstones(db, project_id, versions[project_id], subtree_ids)
+        adjust_task_summary(db, removed=count_task_summary(db, subtree_ids))
+    db.query(models.Comment).filter(models.Comment.task_id.in_(subtree_ids)).delete(synchronize_session=False)
+    db.query(models.Task).filter(models.Task.id.in_(subtree_ids)).delete(synchronize_session="fetch")
+    # subscribers drop the whole subtree under each deleted id
+    events.emit(db, project_id, "task.deleted", {"ids": [task_id]})
+    on_commit(db, lambda: schedule_service.invalidate(project_id))
+    return True
+
+def subtree_cte(task_id: str):
+    # UNION (not UNION ALL) so a corrupted parent cycle cannot recurse forever
+    subtree = (
+        select(models.Task.id, literal(0).label("depth"))
+        .where(models.Task.id == task_id)
+        .cte("subtree", recursive=True)
+    )
+    return subtree.union(
+        select(models.Task.id, (subtree.c.depth + 1).label("depth"))
+        .where(models.Task.parent_task_id == subtree.c.id)
+    )
+
+def ancestors_cte(task_id: str):
+    ancestors = (
+        select(models.Task.parent_task_id.label("id"), literal(1).label("depth"))
+        .where(models.Task.id == task_id)
+        .cte("ancestors", recursive=True)
+    )
+    return ancestors.union(
+        select(models.Task.parent_task_id, (ancestors.c.depth + 1).label("depth"))
+        .where(models.Task.id == ancestors.c.id)
+    )
+
+def list_subtree_fields(db: Session, task_id: str, fields):
+    subtree = subtree_cte(task_id)
+    stmt = (
+        select_task_fields(fields)
+        .join(subtree, subtree.c.id == models.Task.id)
+        .order_by(subtree.c.depth, models.Task.created_at)
+    )
+    return task_field_rows(db.execute(stmt), fields)
+
+def list_ancestor_fields(db: Session, task_id: str, fields):
+    # root first
+    ancestors = ancestors_cte(task_id)
+    stmt = (
+        select_task_fields(fields)
+        .join(ancestors, ancestors.c.id == models.Task.id)
+        .order_by(ancestors.c.depth.desc())
+    )
+    return task_field_rows(db.execute(stmt), fields)
+
+def is_in_subtree(db: Session, root_id: str, task_id: str) -> bool:
+    subtree = subtree_cte(root_id)
+    return db.execute(select(subtree.c.id).where(subtree.c.id == task_id).limit(1)).first() is not None
+
+def subtree_latest_deadline(db: Session, task_id: str):
+    subtree = subtree_cte(task_id)
+    return db.execute(
+        select(func.max(models.Task.deadline)).where(models.Task.id.in_(select(subtree.c.id)))
+    ).scalar()
+
+def move_task(db: Session, task_id: str, parent_task_id: str = None, project_id: str = None):
+    # re-parent one row; a move to another project relabels the whole subtree in one UPDATE
+    task = get_task(db, task_id)
+    if not task:
+        return None
+    old_project_id = task.project_id
+    versions = bump_project_version(db, old_project_id, project_id)
+    if project_id and project_id != old_project_id:
+        subtree_ids = select(subtree_cte(task_id).c.id)
+        if old_project_id:
+            add_task_tombstones(db, old_project_id, versions[old_project_id], subtree_ids)
+        moved = count_task_summary(db, subtree_ids)
+        adjust_task_summary(
+            db,
+            Counter({(project_id, status, assignee_id): count for (_, status, assignee_id), count in moved.items()}),
+            moved,
+        )
+        db.query(models.Task).filter(models.Task.id.in_(subtree_ids)).update(
+            {models.Task.project_id: project_id, models.Task.change_version: versions[project_id]},
+            synchronize_session="fetch",
+        )
+    else:
+        task.change_version = versions.get(old_project_id, 0)
+    task.parent_task_id = parent_task_id
+    if project_id and project_id != old_project_id:
+        events.emit(db, old_project_id, "task.deleted", {"ids": [task_id]})
+        events.emit(db, project_id, "task.created", lambda: {"tasks": list_subtree_fields(db, task_id, TASK_ROW_FIELDS)})
+    else:
+        events.emit(db, old_project_id, "task.updated", lambda: {"tasks": [serializers.task(task)]})
+    db.flush()
+    on_commit(db, lambda: (schedule_service.invalidate(old_project_id), schedule_service.invalidate(project_id)))
+    return task
 
 def list_tasks_by_project(db: Session, project_id: str):
-    return db.query(models.Task).filter(models.Task.project_id == project_id).order_by(models.Task.created_at.desc()).all()
+    # assignees in one extra IN query rather than a lazy SELECT per task
+    return (
+        db.query(models.Task)
+        .options(selectinload(models.Task.assigned_to))
+        .filter(models.Task.project_id == project_id)
+        .order_by(models.Task.created_at.desc())
+        .all()
+    )
+
+TASK_FIELD_COLUMNS = {
+    "id": models.Task.id,
+    "name": models.Task.name,
+    "description": models.Task.description,
+    "deadline": models.Task.deadline,
+    "status": models.Task.status,
+    "project_id": models.Task.project_id,
+    "assigned_to_id": models.Task.assigned_to_id,
+    "parent_task_id": models.Task.parent_task_id,
+    "created_at": models.Task.created_at,
+    "comment_count": models.Task.comment_count,
+}
+TASK_ROW_FIELDS = tuple(TASK_FIELD_COLUMNS)
+TASK_FIELDS = TASK_ROW_FIELDS + ("assigned_to",)
+ASSIGNEE_COLUMNS = (models.User.id, models.User.email, models.User.first_name, models.User.last_name)
+
+def select_task_fields(fields):
+    """Select only the requested TaskRead fields; "assigned_to" adds an outer join to users."""
+    columns = [TASK_FIELD_COLUMNS[field] for field in fields if field != "assigned_to"]
+    if "assigned_to" not in fields:
+        return select(*columns)
+    return select(*columns, *ASSIGNEE_COLUMNS).outerjoin(
+        models.User, models.User.id == models.Task.assigned_to_id
+    )
+
+def task_field_rows(result, fields):
+    plain = [field for field in fields if field != "assigned_to"]
+    with_assignee = "assigned_to" in fields
+    width = len(plain)
+    rows = []
+    for row in result:
+        item = dict(zip(plain, row))
+        if with_assignee:
+            user_id, email, first_name, last_name = row[width:]
+            item["assigned_to"] = (
+                None if user_id is None
+                else {"id": user_id, "email": email, "first_name": first_name, "last_name": last_name}
+            )
+        rows.append(item)
+    return rows
+
+def list_task_changes(db: Session, project_id: str, since: int, fields):
+    """Tasks written after version ``since`` and ids that left the project since then.
+
+    Both lookups are range scans on (project_id, version) indexes, so the cost
+    follows the number of changes, not the size of the project. A tombstone is
+    skipped when the task is back in the project (moved out and in again).
+    """
+    changed = task_field_rows(
+        db.execute(
+            select_task_fields(fields)
+            .where(models.Task.project_id == project_id, models.Task.change_version > since)
+            .order_by(models.Task.change_version, models.Task.created_at)
+        ),
+        fields,
+    )
+    returned = exists().where(
+        models.Task.id == models.TaskTombstone.task_id, models.Task.project_id == project_id
+    )
+    deleted = db.execute(
+        select(models.TaskTombstone.task_id)
+        .where(models.TaskTombstone.project_id == project_id, models.TaskTombstone.version > since, ~returned)
+        .distinct()
+    ).scalars().all()
+    return changed, deleted
+
+def list_task_fields_by_project(db: Session, project_id: str, fields):
+    stmt = (
+        select_task_fields(fields)
+        .where(models.Task.project_id == project_id)
+        .order_by(models.Task.created_at.desc())
+    )
+    return task_field_rows(db.execute(stmt), fields)
 
 
 def create_comment(db: Session, text: str, task_id: str, author_id: str):
     c = models.Comment(text=text, task_id=task_id, author_id=author_id)
     db.add(c)
-    db.commit()
-    db.refresh(c)
+    task = db.get(models.Task, task_id)
+    if task:
+        # the count is part of the task row, so its change_version (ETag, delta sync) moves too
+        task.comment_count = models.Task.comment_count + 1
+        task.change_version = bump_project_version(db, task.project_id).get(task.project_id, task.change_version)
+    events.emit(db, task.project_id if task else None, "comment.created", lambda: {"comment": serializers.comment(c)})
+    db.flush()
     return c
 
+def list_comments(db: Session, task_id: str, limit: int, after=None):
+    # keyset pagination on (created_at, id), oldest first; walks ix_comments_task_created
+    query = db.query(models.Comment).filter(models.Comment.task_id == task_id)
+    if after:
+        after_created_at, after_id = after
+        query = query.filter(
+            or_(
+                models.Comment.created_at > after_created_at,
+                and_(models.Comment.created_at == after_created_at, models.Comment.id > after_id),
+            )
+        )
+    return query.order_by(models.Comment.created_at, models.Comment.id).limit(limit).all()
+
+
+class ProjectAccess:
+    """Project, owner and the caller's membership, loaded once per request."""
+
+    def __init__(self, project, membership, user_id: str):
+        self.project = project
+        self.membership = membership
+        self.user_id = user_id
+
+    @property
+    def is_owner(self) -> bool:
+        return self.project is not None and self.project.owner_id == self.user_id
+
+    @property
+    def is_member(self) -> bool:
+        return self.membership is not None
+
+    @property
+    def is_owner_or_leader(self) -> bool:
+        return self.is_owner or (self.membership is not None and self.membership.role == "leader")
+
+    @property
+    def can_access(self) -> bool:
+        return self.is_owner or self.is_member
+
+
+def get_project_access(db: Session, project_id: str, user_id: str) -> ProjectAccess:
+    # cached on the session, which lives exactly as long as the request
+    cache = db.info.setdefault("project_access", {})
+    key = (project_id, user_id)
+    if key not in cache:
+        row = (
+            db.query(models.Project, models.ProjectMembership)
+            .outerjoin(
+                models.ProjectMembership,
+                and_(
+                    models.ProjectMembership.project_id == models.Project.id,
+                    models.ProjectMembership.user_id == user_id,
+                ),
+            )
+            .options(joinedload(models.Project.owner))
+            .filter(models.Project.id == project_id)
+            .first()
+        )
+        project, membership = row if row else (None, None)
+        cache[key] = ProjectAccess(project, membership, user_id)
+    return cache[key]
+
+def forget_project_access(db: Session, project_id: str):
+    cache = db.info.get("project_access", {})
+    for key in [key for key in cache if key[0] == project_id]:
+        del cache[key]
 
 def is_project_owner(db: Session, project_id: str, user_id: str) -> bool:
 
-    project = get_project(db, project_id)
-    if not project:
-        return False
-    return project.owner_id == user_id
+    return get_project_access(db, project_id, user_id).is_owner
 
 def is_project_member(db: Session, project_id: str, user_id: str) -> bool:
 
-    membership = get_membership(db, project_id, user_id)
-    return membership is not None
+    return get_project_access(db, project_id, user_id).is_member
 
 def is_project_owner_or_leader(db: Session, project_id: str, user_id: str) -> bool:
 
-    if is_project_owner(db, project_id, user_id):
-        return True
-    membership = get_membership(db, project_id, user_id)
-    return membership is not None and membership.role == "leader"
+    return get_project_access(db, project_id, user_id).is_owner_or_leader
 
 def can_access_project(db: Session, project_id: str, user_id: str) -> bool:
 
-    return is_project_owner(db, project_id, user_id) or is_project_member(db, project_id, user_id)
+    return get_project_access(db, project_id, user_id).can_access
 
 # Invitations
 def create_invitation(db: Session, project_id: str, inviter_id: str, invitee_id: str, role: str = "member"):
@@ -182,10 +762,15 @@ def create_invitation(db: Session, project_id: str, inviter_id: str, invitee_id:
         status=models.InvitationStatusEnum.Pending
     )
     db.add(invitation)
-    db.commit()
-    db.refresh(invitation)
+    bump_project_version(db, project_id)
+    db.flush()
     return invitation
 
+def bulk_create_invitations(db: Session, project_id: str, rows: list):
+    # rows are complete ProjectInvitation mappings with ids; one executemany INSERT
+    db.bulk_insert_mappings(models.ProjectInvitation, rows)
+    bump_project_version(db, project_id)
+
 def get_invitation(db: Session, invitation_id: str):
 
     return db.query(models.ProjectInvitation).get(invitation_id)
@@ -198,11 +783,25 @@ def get_invitation_by_project_and_invitee(db: Session, project_id: str, invitee_
         .first()
     )
 
+def list_pending_invitee_ids(db: Session, project_id: str, user_ids) -> set:
+    rows = db.execute(
+        select(models.ProjectInvitation.invitee_id).where(
+            models.ProjectInvitation.project_id == project_id,
+            models.ProjectInvitation.invitee_id.in_(list(user_ids)),
+            models.ProjectInvitation.status == models.InvitationStatusEnum.Pending,
+        )
+    )
+    return set(rows.scalars())
+
 def list_invitations_by_invitee(db: Session, invitee_id: str):
 
     return (
         db.query(models.ProjectInvitation)
-        .options(joinedload(models.ProjectInvitation.project), joinedload(models.ProjectInvitation.inviter))
+        .options(
+            joinedload(models.ProjectInvitation.project).joinedload(models.Project.owner),
+            joinedload(models.ProjectInvitation.inviter),
+            joinedload(models.ProjectInvitation.invitee),
+        )
         .filter_by(invitee_id=invitee_id, status=models.InvitationStatusEnum.Pending)
         .all()
     )
@@ -227,12 +826,17 @@ def accept_invitation(db: Session, invitation_id: str, user_id: str):
         return None
     
 
-    membership = add_member(db, invitation.project_id, invitation.invitee_id, invitation.role)
-    
+    try:
+        # a savepoint, so a concurrent accept of another invitation to the same
+        # project does not roll back the rest of the request
+        with db.begin_nested():
+            membership = add_member(db, invitation.project_id, invitation.invitee_id, invitation.role)
+    except IntegrityError:
+        membership = get_membership(db, invitation.project_id, invitation.invitee_id)
 
     invitation.status = models.InvitationStatusEnum.Accepted
-    db.commit()
-    db.refresh(invitation)
+    bump_project_version(db, invitation.project_id)
+    db.flush()
     
     return membership
 
@@ -247,6 +851,6 @@ def decline_invitation(db: Session, invitation_id: str, user_id: str):
         return None
     
     invitation.status = models.InvitationStatusEnum.Declined
-    db.commit()
-    db.refresh(invitation)
+    bump_project_version(db, invitation.project_id)
+    db.flush()
     return invitation
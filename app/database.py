@@ -1,17 +1,315 @@
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+from pathlib import Path
+
+from fastapi import Request
+
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from app.config import DATABASE_URL
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from app import metrics
+from app.config import (
+    DATABASE_URL,
+    DATABASE_REPLICA_URLS,
+    REPLICA_STICKY_SECONDS,
+    DATABASE_ASYNC,
+    ASYNC_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_PRE_PING,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_STATEMENT_TIMEOUT_MS,
+)
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+READ_METHODS = {"GET", "HEAD"}
+# read-your-writes marker: the time of the client's last committed write, echoed back on every request
+LAST_WRITE_HEADER = "X-Last-Write"
 
-Base = declarative_base()
+# checkout wait buckets, milliseconds
+POOL_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+def instrumented_pool(pool_class):
+    """Subclass ``pool_class`` to time every checkout and count pool timeouts."""
+
+    class InstrumentedPool(pool_class):
+        checkout_wait_ms = metrics.Histogram(POOL_WAIT_BUCKETS_MS)
+        timeouts = 0
+
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            except PoolTimeoutError:
+                type(self).timeouts += 1
+                raise
+            finally:
+                type(self).checkout_wait_ms.observe((time.perf_counter() - start) * 1000)
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
+
+
+def engine_options(url: str, pool_class, driver: str = "psycopg2") -> dict:
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith("sqlite:")):
+        return {}
+    options = {
+        "poolclass": instrumented_pool(pool_class),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+    }
+    if DB_STATEMENT_TIMEOUT_MS and url.startswith("postgresql"):
+        if driver == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+
+def use_sqlite_begin(engine):
+    """Make SQLAlchemy emit BEGIN on SQLite instead of pysqlite.
+
+    pysqlite only opens a transaction before DML, so a SAVEPOINT issued first
+    becomes the outer transaction and its RELEASE commits everything.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
 
 
-def get_db():
-    db = SessionLocal()
+def pool_stats(pool) -> dict:
+    if not hasattr(pool, "checkedout"):
+        return {"pool": type(pool).__name__}
+    stats = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+    if hasattr(pool, "checkout_wait_ms"):
+        stats["timeouts"] = pool.timeouts
+        stats["checkout_wait_ms"] = pool.checkout_wait_ms.snapshot()
+    return stats
+
+
+class ReplicaRouter:
+    """Chooses the engine for a request's session.
+
+    Read-only requests are spread over the replicas round-robin; writes, and
+    reads from a client whose last write (the ``X-Last-Write`` marker it
+    sends back) is less than ``sticky_seconds`` old, go to the primary so
+    users see their own changes despite replication lag. The marker travels
+    with the client, so this holds whichever worker serves the next request.
+    """
+
+    def __init__(self, primary, replicas, sticky_seconds: float = REPLICA_STICKY_SECONDS):
+        self.primary = primary
+        self.replicas = replicas
+        self.sticky_seconds = sticky_seconds
+        self.replica_reads = 0
+        self.sticky_reads = 0
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+
+    def engine_for(self, read_only: bool, last_write: float = None):
+        if not read_only or not self.replicas:
+            return self.primary
+        # a marker from the future (clock skew) counts as recent, but only within the window
+        if last_write is not None and abs(time.time() - last_write) < self.sticky_seconds:
+            with self._lock:
+                self.sticky_reads += 1
+            return self.primary
+        with self._lock:
+            self.replica_reads += 1
+        return self.replicas[next(self._next) % len(self.replicas)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "replicas": len(self.replicas),
+                "replica_reads": self.replica_reads,
+                "sticky_reads": self.sticky_reads,
+            }
+
+
+class RoutingSession(Session):
+    """Session that binds to the engine picked by its ``ReplicaRouter`` on first use.
+
+    ``get_db`` marks sessions of GET/HEAD requests ``read_only`` and stores
+    the client's ``last_write`` marker. The choice is made once, so a request
+    never mixes primary and replica rows.
+    """
+
+    def __init__(self, *args, router: ReplicaRouter, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, **kwargs):
+        engine = self.info.get("engine")
+        if engine is None:
+            engine = self.info["engine"] = self.router.engine_for(
+                self.info.get("read_only", False), self.info.get("last_write")
+            )
+        return engine
+
+
+def last_write_marker(request: Request):
+    # EventSource cannot send headers, so the marker may also come as ?last_write=
+    value = request.headers.get(LAST_WRITE_HEADER) or request.query_params.get("last_write")
     try:
-        yield db
-    finally:
-        db.close()
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def mark_write(session):
+    """Hand the client a fresh marker (see ``LastWriteMiddleware``) so its next reads stay on the primary."""
+    state = session.info.get("request_state")
+    if state is not None:
+        state.last_write = time.time()
+
+
+@event.listens_for(Session, "after_commit")
+def _record_write(session):
+    if not session.info.get("read_only") and not session.in_nested_transaction():
+        mark_write(session)
+
+
+def session_options(primary, replicas) -> dict:
+    if not replicas:
+        return {}
+    return {"router": ReplicaRouter(primary, replicas)}
+
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL, QueuePool))
+use_sqlite_begin(engine)
+replica_engines = [create_engine(url, **engine_options(url, QueuePool)) for url in DATABASE_REPLICA_URLS]
+for replica_engine in replica_engines:
+    use_sqlite_begin(replica_engine)
+# crud only flushes and the request commits once; keep loaded state after commit for serialization
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+    class_=RoutingSession if replica_engines else Session,
+    **session_options(engine, replica_engines),
+)
+
+Base = declarative_base()
+
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+BASELINE_REVISION = "0001"
+
+
+def alembic_config():
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(Path(__file__).resolve().parent / "migrations"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def init_db():
+    """Create a fresh schema, or bring an existing one up to the latest migration."""
+    from alembic import command
+
+    config = alembic_config()
+    tables = set(inspect(engine).get_table_names())
+    if "alembic_version" not in tables:
+        if "users" not in tables:
+            Base.metadata.create_all(bind=engine)
+            command.stamp(config, "head")
+            return
+        # schema created by create_all before migrations were introduced
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
+
+def async_url(url: str) -> str:
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+if DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    _async_url = ASYNC_DATABASE_URL or async_url(DATABASE_URL)
+    async_engine = create_async_engine(
+        _async_url, **engine_options(_async_url, AsyncAdaptedQueuePool, driver="asyncpg")
+    )
+    use_sqlite_begin(async_engine.sync_engine)
+    async_replica_engines = []
+    for url in DATABASE_REPLICA_URLS:
+        url = async_url(url)
+        async_replica_engines.append(create_async_engine(url, **engine_options(url, AsyncAdaptedQueuePool, driver="asyncpg")))
+        use_sqlite_begin(async_replica_engines[-1].sync_engine)
+    AsyncSessionLocal = sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession if async_replica_engines else Session,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        **session_options(async_engine.sync_engine, [replica.sync_engine for replica in async_replica_engines]),
+    )
+
+    async def get_db(request: Request):
+        async with AsyncSessionLocal() as db:
+            db.info["read_only"] = request.method in READ_METHODS
+            db.info["last_write"] = last_write_marker(request)
+            db.info["request_state"] = request.state
+            yield db
+
+else:
+
+    def get_db(request: Request):
+        db = SessionLocal()
+        db.info["read_only"] = request.method in READ_METHODS
+        db.info["last_write"] = last_write_marker(request)
+        db.info["request_state"] = request.state
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+def _pool_metrics():
+    stats = {"primary": pool_stats(engine.pool)}
+    for index, replica_engine in enumerate(replica_engines):
+        stats[f"replica_{index}"] = pool_stats(replica_engine.pool)
+    if DATABASE_ASYNC:
+        stats["primary_async"] = pool_stats(async_engine.pool)
+        for index, replica_engine in enumerate(async_replica_engines):
+            stats[f"replica_{index}_async"] = pool_stats(replica_engine.pool)
+    return stats
+
+
+def _router_metrics():
+    session_class = AsyncSessionLocal if DATABASE_ASYNC else SessionLocal
+    router = session_class.kw.get("router")
+    return router.stats() if router else {"replicas": 0}
+
+
+metrics.register("db_pool", _pool_metrics)
+metrics.register("db_replicas", _router_metrics)
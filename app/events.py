@@ -0,0 +1,218 @@
+"""Per-project change feed.
+
+crud queues small delta events on the session with ``emit``; they are rendered
+just before commit and handed to the broker only after the commit succeeds, so
+subscribers never see writes that were rolled back. ``GET /projects/{id}/events``
+streams them to clients as Server-Sent Events.
+"""
+import asyncio
+import threading
+import time
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import metrics
+from app.config import (
+    EVENTS_ACCESS_RECHECK_SECONDS, EVENTS_BACKEND, EVENTS_KEEPALIVE_SECONDS, EVENTS_QUEUE_SIZE, EVENTS_REDIS_URL,
+)
+
+RESYNC = "event: resync\ndata: {}\n\n"
+# events after which a subscriber may no longer be allowed to see the project
+ACCESS_EVENTS = ("event: member.removed\n",)
+# delivered as-is, then the stream ends: the project is gone, so an access check would fail for everyone
+FINAL_EVENTS = ("event: project.deleted\n",)
+
+
+def emit(db: Session, project_id: str, event_type: str, data):
+    """Queue an event for ``project_id``; ``data`` is a dict or a callable evaluated after the final flush."""
+    if project_id:
+        db.info.setdefault("pending_events", []).append((project_id, event_type, data))
+
+
+def format_event(project_id: str, event_type: str, data) -> str:
+    body = orjson.dumps({"type": event_type, "project_id": project_id, "data": data}).decode()
+    return f"event: {event_type}\ndata: {body}\n\n"
+
+
+@event.listens_for(Session, "before_commit")
+def _render_events(session):
+    pending = session.info.get("pending_events")
+    if not pending or session.in_nested_transaction():
+        return
+    # defaults (created_at, status) and lazy relationships are only available after the flush
+    session.flush()
+    session.info["pending_events"] = [
+        (project_id, format_event(project_id, event_type, data() if callable(data) else data))
+        for project_id, event_type, data in pending
+    ]
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_events(session):
+    if session.in_nested_transaction():
+        return  # a savepoint was released; wait for the real commit
+    for project_id, message in session.info.pop("pending_events", ()):
+        broker().publish(project_id, message)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_events(session):
+    if session.in_nested_transaction():
+        return  # only a savepoint rolled back
+    session.info.pop("pending_events", None)
+
+
+class Subscription:
+    """One SSE client; messages are pushed from any thread onto its event loop."""
+
+    def __init__(self, project_id: str, loop, maxsize: int):
+        self.project_id = project_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=maxsize)
+
+    def push(self, message: str):
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            pass  # loop already closed; the stream's finally will unsubscribe
+
+    def _put(self, message: str):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # a slow client loses its backlog and is told to refetch instead of stalling publishers
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+
+class MemoryBroker:
+    """In-process fan-out; enough for a single worker."""
+
+    def __init__(self, queue_size: int = EVENTS_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, project_id: str) -> Subscription:
+        subscription = Subscription(project_id, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+
+    def publish(self, project_id: str, message: str):
+        self.deliver(project_id, message)
+
+    def deliver(self, project_id: str, message: str):
+        with self._lock:
+            subscribers = list(self._subscribers.get(project_id, ()))
+            self.published += 1
+        for subscription in subscribers:
+            subscription.push(message)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": type(self).__name__,
+                "projects": len(self._subscribers),
+                "subscribers": sum(len(s) for s in self._subscribers.values()),
+                "published": self.published,
+            }
+
+
+class RedisBroker(MemoryBroker):
+    """Publishes through Redis pub/sub so subscribers on every worker see every write."""
+
+    def __init__(self, url: str, prefix: str = "reversegantt:project:", queue_size: int = EVENTS_QUEUE_SIZE):
+        super().__init__(queue_size)
+        import redis  # optional dependency, only needed for EVENTS_BACKEND=redis
+
+        self.redis = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self._listener = threading.Thread(target=self._listen, name="events-redis", daemon=True)
+        self._listener.start()
+
+    def publish(self, project_id: str, message: str):
+        self.redis.publish(self.prefix + project_id, message)
+
+    def _listen(self):
+        import redis
+
+        while True:
+            try:
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(self.prefix + "*")
+                for item in pubsub.listen():
+                    project_id = item["channel"].decode()[len(self.prefix):]
+                    self.deliver(project_id, item["data"].decode())
+            except redis.RedisError:
+                time.sleep(1)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def broker() -> MemoryBroker:
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = RedisBroker(EVENTS_REDIS_URL) if EVENTS_BACKEND == "redis" else MemoryBroker()
+    return _broker
+
+
+async def sse_stream(subscription: Subscription, is_disconnected, authorize=None, expires_at: float = None):
+    """Stream a subscription until the client leaves or loses access.
+
+    ``authorize`` is an async callable that re-checks the subscriber's token
+    and project access. It runs before delivering an event that may revoke
+    access, and at least every EVENTS_ACCESS_RECHECK_SECONDS. The stream also
+    ends at ``expires_at`` (the token's exp). In both cases the client gets a
+    final ``revoked`` event. After ``project.deleted`` the stream ends without
+    a check.
+    """
+    loop = asyncio.get_running_loop()
+    next_check = loop.time() + EVENTS_ACCESS_RECHECK_SECONDS
+    try:
+        yield "retry: 3000\n\n"
+        while not await is_disconnected():
+            timeout = min(EVENTS_KEEPALIVE_SECONDS, max(0.0, next_check - loop.time()))
+            if expires_at is not None:
+                remaining = expires_at - time.time()
+                if remaining <= 0:
+                    yield format_event(subscription.project_id, "revoked", {"reason": "expired"})
+                    return
+                timeout = min(timeout, remaining)
+            try:
+                message = await asyncio.wait_for(subscription.get(), timeout)
+            except asyncio.TimeoutError:
+                message = ": keepalive\n\n"
+            if message.startswith(FINAL_EVENTS):
+                yield message
+                return
+            if authorize is not None and (message.startswith(ACCESS_EVENTS) or loop.time() >= next_check):
+                next_check = loop.time() + EVENTS_ACCESS_RECHECK_SECONDS
+                if not await authorize():
+                    yield format_event(subscription.project_id, "revoked", {"reason": "forbidden"})
+                    return
+            yield message
+    finally:
+        broker().unsubscribe(subscription)
+
+
+metrics.register("events", lambda: broker().stats())
@@ -0,0 +1,111 @@
+"""bcrypt on a dedicated, size-limited process pool.
+
+Hashing is CPU-bound and holds the GIL, so running it on request threads lets
+a login burst starve every other endpoint. Jobs go to HASH_POOL_SIZE worker
+processes instead; once HASH_MAX_PENDING jobs are queued or running, new
+auth requests are refused with 503 rather than piling up.
+"""
+import asyncio
+import atexit
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app import metrics
+from app.config import HASH_MAX_PENDING, HASH_POOL_SIZE
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+HASH_LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, hashed: str) -> bool:
+    return pwd_context.verify(password, hashed)
+
+
+def _ping():
+    return None
+
+
+def busy() -> HTTPException:
+    return HTTPException(status_code=503, detail="Authentication is busy, retry shortly", headers={"Retry-After": "1"})
+
+
+class HashingPool:
+    def __init__(self, size: int = HASH_POOL_SIZE, max_pending: int = HASH_MAX_PENDING):
+        self.size = size
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self.latency = metrics.Histogram(HASH_LATENCY_BUCKETS_MS)
+        self._executor = None
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs threads and an event loop is unsafe
+                self._executor = ProcessPoolExecutor(self.size, mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def start(self):
+        # pay the worker start-up cost at boot instead of on the first login
+        for future in [self.executor().submit(_ping) for _ in range(self.size)]:
+            future.result()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, func, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise busy()
+            self.pending += 1
+        start = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(self.executor().submit(func, *args))
+        except BrokenProcessPool:
+            # a worker died (e.g. OOM-killed); the next call starts a fresh pool
+            self.shutdown()
+            raise busy()
+        finally:
+            self.latency.observe((time.perf_counter() - start) * 1000)
+            with self._lock:
+                self.pending -= 1
+
+    def stats(self) -> dict:
+        return {
+            "pool_size": self.size,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+            "latency_ms": self.latency.snapshot(),
+        }
+
+
+hashing_pool = HashingPool()
+
+
+async def hash_password(password: str) -> str:
+    return await hashing_pool.run(_hash, password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    return await hashing_pool.run(_verify, password, hashed)
+
+
+metrics.register("hashing", hashing_pool.stats)
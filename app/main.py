@@ -1,34 +1,64 @@
+import hmac
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import FastAPI, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session, joinedload
-from datetime import datetime, timedelta
-
-from app.database import Base, engine, get_db
-from app import crud, schemas
-from app.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from datetime import datetime, timedelta, timezone
+
+from app.database import LAST_WRITE_HEADER, SessionLocal, get_db, init_db, mark_write
+from app import crud, events, hashing, metrics, schemas, serializers
+from app.auth_cache import UserSnapshot, token_cache, user_cache
+from app.pagination import encode_cursor, decode_cursor, decode_offset_cursor, decode_sync_cursor
+from app.conditional import project_etag, etag_headers, etag_matches, not_modified
+from app.routing import LastWriteMiddleware, SessionRoute, call_db, run_in_session
+from app.services.overdue_service import overdue_sweeper
+from app.services.project_service import ProjectService
+from app.services.schedule_service import schedule_service
+from app.services.search_service import search_service
+from app.services.task_service import TaskService
+from app.services import export_service
+from app.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, DB_AUTO_MIGRATE, BULK_TASKS_MAX, BULK_INVITATIONS_MAX, SEARCH_MAX_OFFSET, METRICS_TOKEN
 from jose import jwt, JWTError
 
 
-Base.metadata.create_all(bind=engine)
+if DB_AUTO_MIGRATE:
+    init_db()
 
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(hashing.hashing_pool.start)
+    sweeper = overdue_sweeper.start()
+    yield
+    if sweeper is not None:
+        sweeper.cancel()
+    hashing.hashing_pool.shutdown()
 
-app = FastAPI(title="Project Management API (from UML)")
 
+app = FastAPI(title="Project Management API (from UML)", lifespan=lifespan)
+app.router.route_class = SessionRoute
+
+app.add_middleware(LastWriteMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Sync-Cursor", "ETag", LAST_WRITE_HEADER],
 )
 
 security = HTTPBearer()
+task_service = TaskService()
+project_service = ProjectService()
 
 FRONTEND_DIR = Path(__file__).resolve().parents[1] / "frontend"
 if FRONTEND_DIR.exists():
@@ -51,40 +81,75 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     encoded = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded
 
+def resolve_user(token: str, db: Session):
+    user_id = token_cache.get(token)
+    if user_id is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+        user_id = payload.get("sub")
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Invalid token payload")
+        token_cache.set(token, user_id, expires_at=payload.get("exp"))
+
+    user = user_cache.get(user_id)
+    if user is None:
+        db_user = crud.get_user(db, user_id)
+        if not db_user:
+            raise HTTPException(status_code=401, detail="User not found")
+        user = UserSnapshot.from_user(db_user)
+        user_cache.set(user_id, user)
+
+    return user
+
+@run_in_session
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ):
-    token = credentials.credentials
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Invalid token payload")
-
-    user = crud.get_user(db, user_id)
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
+    return resolve_user(credentials.credentials, db)
 
-    return user
+def get_stream_token(
+    token: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+):
+    # EventSource cannot send headers, so the feed also accepts ?token=
+    if credentials:
+        token = credentials.credentials
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return token
+
+@run_in_session
+def get_stream_user(
+    token: str = Depends(get_stream_token),
+    db: Session = Depends(get_db),
+):
+    return resolve_user(token, db)
 
 
 @app.post("/register", response_model=schemas.UserRead)
-def register(payload: schemas.UserCreate, db: Session = Depends(get_db)):
-    if crud.get_user_by_email(db, payload.email):
+async def register(payload: schemas.UserCreate, db: Session = Depends(get_db)):
+    exists = await call_db(db, crud.get_user_credentials, payload.email)
+    # end the read transaction so no pooled connection is held while bcrypt runs
+    await call_db(db, Session.rollback)
+    if exists:
         raise HTTPException(status_code=400, detail="User already exists")
-    user = crud.create_user(db, payload.email, payload.password, payload.first_name, payload.last_name)
+    hashed = await hashing.hash_password(payload.password)
+    user = await call_db(db, crud.create_user, payload.email, hashed, payload.first_name, payload.last_name)
     return user
 
 @app.post("/login", response_model=schemas.Token)
-def login(payload: schemas.UserCreate, db: Session = Depends(get_db)):
-    user = crud.get_user_by_email(db, payload.email)
-    if not user or not crud.verify_password(payload.password, user.hashed_password):
+async def login(payload: schemas.UserCreate, db: Session = Depends(get_db)):
+    credentials = await call_db(db, crud.get_user_credentials, payload.email)
+    await call_db(db, Session.rollback)  # as in register: nothing held across the hash check
+    if not credentials or not await hashing.verify_password(payload.password, credentials[1]):
         raise HTTPException(status_code=400, detail="Invalid credentials")
-    token = create_access_token({"sub": user.id})
+    token = create_access_token({"sub": credentials[0]})
+    # the account may have been created moments ago; keep the first reads off lagging replicas
+    mark_write(db)
     return {"access_token": token, "token_type": "bearer"}
 
 @app.get("/users/me", response_model=schemas.UserRead)
@@ -92,6 +157,14 @@ def get_current_user_info(current_user=Depends(get_current_user)):
     return current_user
 
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics(credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))):
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not credentials or not hmac.compare_digest(credentials.credentials, METRICS_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return metrics.snapshot()
+
 
 
 @app.post("/projects", response_model=schemas.ProjectRead)
@@ -110,32 +183,43 @@ def create_project(
 
 @app.get("/projects", response_model=List[schemas.ProjectRead])
 def list_projects(
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    after: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
 
-    all_projects = crud.list_projects(db)
-    user_projects = []
-    for project in all_projects:
-        if crud.can_access_project(db, project.id, current_user.id):
-            user_projects.append(project)
-    return user_projects
+    projects = crud.list_projects_for_user(
+        db,
+        current_user.id,
+        limit=limit,
+        after=decode_cursor(after) if after else None,
+    )
+    headers = None
+    if limit and len(projects) == limit:
+        last = projects[-1]
+        headers = {"X-Next-Cursor": encode_cursor(last.created_at, last.id)}
+    return serializers.many(serializers.project, projects, headers=headers)
 
 @app.get("/projects/{project_id}", response_model=schemas.ProjectRead)
 def get_project(
     project_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    p = crud.get_project(db, project_id)
-    if not p:
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
         raise HTTPException(status_code=404, detail="Project not found")
     
 
-    if not crud.can_access_project(db, project_id, current_user.id):
+    if not access.can_access:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    return p
+    etag = project_etag(access.project)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return serializers.FastJSONResponse(serializers.project(access.project), headers=etag_headers(etag))
 
 @app.put("/projects/{project_id}", response_model=schemas.ProjectRead)
 def edit_project(
@@ -144,12 +228,12 @@ def edit_project(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    p = crud.get_project(db, project_id)
-    if not p:
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
         raise HTTPException(status_code=404, detail="Project not found")
     
 
-    if not crud.is_project_owner(db, project_id, current_user.id):
+    if not access.is_owner:
         raise HTTPException(status_code=403, detail="Only project owner can edit project")
     
     p = crud.edit_project(db, project_id, payload.name, payload.final_deadline)
@@ -163,12 +247,12 @@ def delete_project(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    p = crud.get_project(db, project_id)
-    if not p:
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
         raise HTTPException(status_code=404, detail="Project not found")
     
 
-    if not crud.is_project_owner(db, project_id, current_user.id):
+    if not access.is_owner:
         raise HTTPException(status_code=403, detail="Only project owner can delete project")
     
     ok = crud.delete_project(db, project_id)
@@ -180,14 +264,20 @@ def delete_project(
 @app.get("/projects/{project_id}/members", response_model=List[schemas.ProjectMembershipRead])
 def list_project_members(
     project_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
 
-    if not crud.can_access_project(db, project_id, current_user.id):
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.can_access:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    return crud.list_members_by_project(db, project_id)
+    etag = project_etag(access.project)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    members = crud.list_members_by_project(db, project_id)
+    return serializers.many(serializers.membership, members, headers=etag_headers(etag))
 
 
 @app.delete("/memberships/{membership_id}")
@@ -202,12 +292,12 @@ def kick_member(
         raise HTTPException(status_code=404, detail="Membership not found")
     
 
-    if not crud.is_project_owner_or_leader(db, mem.project_id, current_user.id):
+    access = crud.get_project_access(db, mem.project_id, current_user.id)
+    if not access.is_owner_or_leader:
         raise HTTPException(status_code=403, detail="Only project owner or leader can remove members")
 
 
-    project = crud.get_project(db, mem.project_id)
-    if project and project.owner_id == mem.user_id:
+    if access.project and access.project.owner_id == mem.user_id:
         raise HTTPException(status_code=400, detail="Cannot remove project owner")
     
     ok = crud.remove_membership(db, membership_id)
@@ -228,12 +318,12 @@ def update_membership_role(
         raise HTTPException(status_code=404, detail="Membership not found")
 
 
-    if not crud.is_project_owner_or_leader(db, mem.project_id, current_user.id):
+    access = crud.get_project_access(db, mem.project_id, current_user.id)
+    if not access.is_owner_or_leader:
         raise HTTPException(status_code=403, detail="Only project owner or leader can change roles")
 
 
-    project = crud.get_project(db, mem.project_id)
-    if project and project.owner_id == mem.user_id:
+    if access.project and access.project.owner_id == mem.user_id:
         raise HTTPException(status_code=400, detail="Cannot change role of project owner")
 
     updated = crud.set_membership_role(db, membership_id, payload.role)
@@ -259,9 +349,10 @@ def create_task(
     if not payload.project_id:
         raise HTTPException(status_code=400, detail="project_id is required")
     
-    if not crud.can_access_project(db, payload.project_id, current_user.id):
+    access = crud.get_project_access(db, payload.project_id, current_user.id)
+    if not access.can_access:
         raise HTTPException(status_code=403, detail="Access denied to project")
-    project = crud.get_project(db, payload.project_id)
+    project = access.project
 
     if project and project.final_deadline and payload.deadline:
         if payload.deadline.date() > project.final_deadline.date():
@@ -276,18 +367,226 @@ def create_task(
     task = crud.create_task(db, **data)
     return task
 
-@app.get("/projects/{project_id}/tasks", response_model=List[schemas.TaskRead])
+def parse_task_fields(fields: Optional[str]):
+    # ?fields=id,name,deadline -> ordered, de-duplicated list of TaskRead keys
+    if not fields:
+        return None
+    requested = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = [field for field in requested if field not in crud.TASK_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(crud.TASK_FIELDS)}",
+        )
+    return requested
+
+@app.get("/projects/{project_id}/tasks", response_model=Union[List[schemas.TaskRead], schemas.TaskSyncRead])
 def list_project_tasks(
     project_id: str,
+    request: Request,
+    fields: Optional[str] = None,
+    since: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
 
-    if not crud.can_access_project(db, project_id, current_user.id):
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.can_access:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    tasks = crud.list_tasks_by_project(db, project_id)
-    return tasks
+    requested = parse_task_fields(fields) or crud.TASK_FIELDS
+    etag = project_etag(access.project)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    # read before the rows: a write landing in between is re-sent next time rather than missed
+    cursor = str(access.project.version)
+    headers = {**etag_headers(etag), "X-Sync-Cursor": cursor}
+    if since is None:
+        tasks = crud.list_task_fields_by_project(db, project_id, requested)
+        return serializers.FastJSONResponse(tasks, headers=headers)
+
+    since_version = decode_sync_cursor(since)
+    if since_version > access.project.version:
+        raise HTTPException(status_code=410, detail="Cursor is ahead of the project; fetch the full task list")
+    changed, deleted = [], []
+    if since_version < access.project.version:
+        if "id" not in requested:
+            requested = ["id", *requested]
+        changed, deleted = crud.list_task_changes(db, project_id, since_version, requested)
+    return serializers.FastJSONResponse({"cursor": cursor, "tasks": changed, "deleted": deleted}, headers=headers)
+
+def bulk_task_access(db: Session, project_id: str, user_id: str, size: int):
+    if size > BULK_TASKS_MAX:
+        raise HTTPException(status_code=413, detail=f"At most {BULK_TASKS_MAX} tasks per request")
+    access = crud.get_project_access(db, project_id, user_id)
+    if not access.project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not access.can_access:
+        raise HTTPException(status_code=403, detail="Access denied to project")
+    return access
+
+@app.post("/projects/{project_id}/tasks/bulk", response_model=schemas.TaskBulkResponse)
+def bulk_create_tasks(
+    project_id: str,
+    payload: schemas.TaskBulkCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+
+    access = bulk_task_access(db, project_id, current_user.id, len(payload.tasks))
+    return task_service.bulk_create(db, access, current_user.id, payload.tasks)
+
+@app.patch("/projects/{project_id}/tasks/bulk", response_model=schemas.TaskBulkResponse)
+def bulk_update_tasks(
+    project_id: str,
+    payload: schemas.TaskBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+
+    access = bulk_task_access(db, project_id, current_user.id, len(payload.tasks))
+    return task_service.bulk_update(db, access, current_user.id, payload.tasks)
+
+@app.get("/projects/{project_id}/schedule", response_model=schemas.ProjectScheduleRead)
+def get_project_schedule(
+    project_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not access.can_access:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    etag = project_etag(access.project)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return Response(schedule_service.get(db, access.project), media_type="application/json", headers=etag_headers(etag))
+
+@app.get("/projects/{project_id}/summary", response_model=schemas.ProjectSummaryRead)
+def get_project_summary(
+    project_id: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not access.can_access:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    # "this week" is the current ISO week (UTC), so the ETag changes on Monday too
+    today = datetime.utcnow().date()
+    week_start = datetime.combine(today - timedelta(days=today.weekday()), datetime.min.time())
+    etag = project_etag(access.project, week_start.strftime("%Y%m%d"))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+    return crud.get_task_summary(db, project_id, week_start, week_start + timedelta(days=7))
+
+@app.get("/projects/{project_id}/timeline", response_model=schemas.ProjectTimelineRead)
+def get_project_timeline(
+    project_id: str,
+    request: Request,
+    window_from: datetime = Query(..., alias="from"),
+    window_to: datetime = Query(..., alias="to"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    # stored datetimes are naive UTC
+    window_from, window_to = (
+        value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+        for value in (window_from, window_to)
+    )
+    if window_from > window_to:
+        raise HTTPException(status_code=400, detail="'from' must not be later than 'to'")
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not access.can_access:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    etag = project_etag(access.project, window_from.strftime("%Y%m%d%H%M%S"), window_to.strftime("%Y%m%d%H%M%S"))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    timeline = crud.get_task_timeline(db, project_id, window_from, window_to)
+    return serializers.FastJSONResponse(timeline, headers=etag_headers(etag))
+
+@run_in_session
+def get_stream_access(
+    project_id: str,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_stream_user),
+):
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not access.can_access:
+        raise HTTPException(status_code=403, detail="Access denied")
+    # end the read transaction so a long-lived stream does not pin a pooled connection
+    db.rollback()
+    return access
+
+def stream_access_allowed(token: str, project_id: str) -> bool:
+    """Re-run the stream's token and access checks on a short-lived session."""
+    db = SessionLocal()
+    try:
+        user = resolve_user(token, db)
+        return crud.get_project_access(db, project_id, user.id).can_access
+    except HTTPException:
+        return False
+    finally:
+        db.close()
+
+@app.get("/projects/{project_id}/events")
+async def project_events(
+    project_id: str,
+    request: Request,
+    token: str = Depends(get_stream_token),
+    access=Depends(get_stream_access),
+):
+    subscription = events.broker().subscribe(project_id)
+    return StreamingResponse(
+        events.sse_stream(
+            subscription,
+            request.is_disconnected,
+            authorize=lambda: run_in_threadpool(stream_access_allowed, token, project_id),
+            # already verified by get_stream_user
+            expires_at=jwt.get_unverified_claims(token).get("exp"),
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/projects/{project_id}/tasks/export")
+def export_project_tasks(
+    project_id: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not access.can_access:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    if format == "csv":
+        body, media_type = export_service.csv_stream(project_id), "text/csv; charset=utf-8"
+    else:
+        body, media_type = export_service.ndjson_stream(project_id), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks-{project_id}.{format}"'},
+    )
 
 @app.get("/tasks/{task_id}", response_model=schemas.TaskRead)
 def get_task(
@@ -317,21 +616,25 @@ def edit_task(
         raise HTTPException(status_code=404, detail="Task not found")
     
 
-    if t.project_id and not crud.can_access_project(db, t.project_id, current_user.id):
+    access = crud.get_project_access(db, t.project_id, current_user.id)
+    if t.project_id and not access.can_access:
         raise HTTPException(status_code=403, detail="Access denied")
     
 
     data = payload.dict()
     if "assigned_to_id" in data and data["assigned_to_id"] != t.assigned_to_id:
-        if not crud.is_project_owner_or_leader(db, t.project_id, current_user.id):
+        if not access.is_owner_or_leader:
             raise HTTPException(status_code=403, detail="Only project owner or leader can reassign task")
 
         if data["assigned_to_id"]:
             membership = crud.get_membership(db, t.project_id, data["assigned_to_id"])
-            if not membership and crud.get_project(db, t.project_id).owner_id != data["assigned_to_id"]:
+            if not membership and access.project.owner_id != data["assigned_to_id"]:
                 raise HTTPException(status_code=400, detail="Assignee must be a project member or owner")
+    if data.get("parent_task_id") and data["parent_task_id"] != t.parent_task_id:
+        if crud.is_in_subtree(db, task_id, data["parent_task_id"]):
+            raise HTTPException(status_code=400, detail="Cannot move a task under its own subtree")
     if t.project_id and payload.deadline:
-        project = crud.get_project(db, t.project_id)
+        project = access.project
         if project and project.final_deadline:
             if payload.deadline.date() > project.final_deadline.date():
                 raise HTTPException(
@@ -364,6 +667,75 @@ def change_task_status(
     t = crud.edit_task(db, task_id, status=payload.status)
     return t
 
+@app.get("/tasks/{task_id}/subtree", response_model=List[schemas.TaskRead])
+def get_task_subtree(
+    task_id: str,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    t = crud.get_task(db, task_id)
+    if not t:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    if t.project_id and not crud.can_access_project(db, t.project_id, current_user.id):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    requested = parse_task_fields(fields) or crud.TASK_FIELDS
+    return serializers.FastJSONResponse(crud.list_subtree_fields(db, task_id, requested))
+
+@app.get("/tasks/{task_id}/ancestors", response_model=List[schemas.TaskRead])
+def get_task_ancestors(
+    task_id: str,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    t = crud.get_task(db, task_id)
+    if not t:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    if t.project_id and not crud.can_access_project(db, t.project_id, current_user.id):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    return serializers.FastJSONResponse(crud.list_ancestor_fields(db, task_id, crud.TASK_FIELDS))
+
+@app.patch("/tasks/{task_id}/parent", response_model=schemas.TaskRead)
+def move_task(
+    task_id: str,
+    payload: schemas.TaskMove,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    t = crud.get_task(db, task_id)
+    if not t:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    if t.project_id and not crud.can_access_project(db, t.project_id, current_user.id):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    target_project_id = t.project_id
+    if payload.parent_task_id:
+        parent = crud.get_task(db, payload.parent_task_id)
+        if not parent:
+            raise HTTPException(status_code=404, detail="Parent task not found")
+        if crud.is_in_subtree(db, task_id, parent.id):
+            raise HTTPException(status_code=400, detail="Cannot move a task under its own subtree")
+
+        if parent.project_id != t.project_id:
+            target = crud.get_project_access(db, parent.project_id, current_user.id)
+            if not target.can_access:
+                raise HTTPException(status_code=403, detail="Access denied to target project")
+            final_deadline = target.project.final_deadline
+            latest = crud.subtree_latest_deadline(db, task_id)
+            if final_deadline and latest and latest.date() > final_deadline.date():
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Task deadline cannot be later than project deadline ({final_deadline.strftime('%Y-%m-%d')})"
+                )
+            target_project_id = parent.project_id
+
+    return crud.move_task(db, task_id, payload.parent_task_id, target_project_id)
+
 @app.delete("/tasks/{task_id}")
 def delete_task(
     task_id: str,
@@ -401,6 +773,43 @@ def create_comment(
     c = crud.create_comment(db, text=payload.text, task_id=payload.task_id, author_id=current_user.id)
     return c
 
+@app.get("/tasks/{task_id}/comments", response_model=List[schemas.CommentRead])
+def list_task_comments(
+    task_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    task = crud.get_task(db, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if task.project_id and not crud.can_access_project(db, task.project_id, current_user.id):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    comments = crud.list_comments(db, task_id, limit, after=decode_cursor(after) if after else None)
+    headers = None
+    if len(comments) == limit:
+        last = comments[-1]
+        headers = {"X-Next-Cursor": encode_cursor(last.created_at, last.id)}
+    return serializers.many(serializers.comment, comments, headers=headers)
+
+@app.get("/search", response_model=List[schemas.SearchResult])
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    after: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    # tasks and comments in the caller's projects, best match first
+    offset = decode_offset_cursor(after, SEARCH_MAX_OFFSET) if after else 0
+    results = search_service.search(db, current_user.id, q, limit, offset)
+    headers = None
+    if len(results) == limit and offset + limit <= SEARCH_MAX_OFFSET:
+        headers = {"X-Next-Cursor": str(offset + limit)}
+    return serializers.FastJSONResponse(results, headers=headers)
+
 
 @app.post("/projects/{project_id}/invitations", response_model=schemas.ProjectInvitationRead)
 def create_invitation(
@@ -410,12 +819,12 @@ def create_invitation(
     current_user=Depends(get_current_user),
 ):
 
-    project = crud.get_project(db, project_id)
-    if not project:
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
         raise HTTPException(status_code=404, detail="Project not found")
     
 
-    if not crud.is_project_owner_or_leader(db, project_id, current_user.id):
+    if not access.is_owner_or_leader:
         raise HTTPException(status_code=403, detail="Only project owner or leader can invite members")
     
 
@@ -439,6 +848,23 @@ def create_invitation(
     invitation = crud.create_invitation(db, project_id, current_user.id, invitee.id, payload.role)
     return invitation
 
+@app.post("/projects/{project_id}/invitations/bulk", response_model=schemas.InvitationBulkResponse)
+def bulk_create_invitations(
+    project_id: str,
+    payload: schemas.ProjectInvitationBulkCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+
+    if len(payload.invitations) > BULK_INVITATIONS_MAX:
+        raise HTTPException(status_code=413, detail=f"At most {BULK_INVITATIONS_MAX} invitations per request")
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not access.is_owner_or_leader:
+        raise HTTPException(status_code=403, detail="Only project owner or leader can invite members")
+    return project_service.bulk_invite(db, project_id, current_user.id, payload.invitations)
+
 @app.get("/invitations", response_model=List[schemas.ProjectInvitationRead])
 def list_my_invitations(
     db: Session = Depends(get_db),
@@ -446,7 +872,7 @@ def list_my_invitations(
 ):
 
     invitations = crud.list_invitations_by_invitee(db, current_user.id)
-    return invitations
+    return serializers.many(serializers.invitation, invitations)
 
 @app.post("/invitations/{invitation_id}/accept", response_model=schemas.ProjectMembershipRead)
 def accept_invitation(
@@ -475,19 +901,23 @@ def decline_invitation(
 @app.get("/projects/{project_id}/invitations", response_model=List[schemas.ProjectInvitationRead])
 def list_project_invitations(
     project_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
 
-    project = crud.get_project(db, project_id)
-    if not project:
+    access = crud.get_project_access(db, project_id, current_user.id)
+    if not access.project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    if not crud.is_project_owner_or_leader(db, project_id, current_user.id):
+    if not access.is_owner_or_leader:
         raise HTTPException(status_code=403, detail="Only project owner or leader can view invitations")
     
+    etag = project_etag(access.project)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     invitations = crud.list_invitations_by_project(db, project_id)
-    return invitations
+    return serializers.many(serializers.invitation, invitations, headers=etag_headers(etag))
 
 
 @app.get("/{page:path}", include_in_schema=False)
@@ -0,0 +1,44 @@
+import bisect
+import threading
+
+
+_sources = {}
+
+
+def register(name: str, source):
+    """Register a zero-argument callable whose dict result is reported under ``name``."""
+    _sources[name] = source
+
+
+def snapshot() -> dict:
+    return {name: source() for name, source in _sources.items()}
+
+
+class Histogram:
+    """Fixed-bucket histogram; ``buckets`` are inclusive upper bounds."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self.counts)
+            count, total = self.count, self.total
+        labels = [f"le_{bound:g}" for bound in self.buckets] + ["inf"]
+        return {
+            "count": count,
+            "sum": round(total, 3),
+            "mean": round(total / count, 3) if count else None,
+            "buckets": dict(zip(labels, counts)),
+        }
@@ -0,0 +1,89 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+Databases created by Base.metadata.create_all before migrations existed
+are stamped at this revision.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("first_name", sa.String(), nullable=True),
+        sa.Column("last_name", sa.String(), nullable=True),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("final_deadline", sa.DateTime(), nullable=True),
+        sa.Column("owner_id", sa.String(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("deadline", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("New", "InProgress", "UnderReview", "Completed", "Overdue", name="taskstatusenum"),
+            nullable=True,
+        ),
+        sa.Column("project_id", sa.String(), sa.ForeignKey("projects.id"), nullable=True),
+        sa.Column("parent_task_id", sa.String(), sa.ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True),
+        sa.Column("assigned_to_id", sa.String(), sa.ForeignKey("users.id"), nullable=True),
+    )
+    op.create_table(
+        "comments",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("text", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("author_id", sa.String(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("task_id", sa.String(), sa.ForeignKey("tasks.id"), nullable=True),
+    )
+    op.create_table(
+        "project_memberships",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("project_id", sa.String(), sa.ForeignKey("projects.id"), nullable=True),
+        sa.Column("role", sa.String(), nullable=True),
+    )
+    op.create_table(
+        "project_invitations",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("project_id", sa.String(), sa.ForeignKey("projects.id"), nullable=False),
+        sa.Column("inviter_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("invitee_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("role", sa.String(), nullable=True),
+        sa.Column("status", sa.Enum("Pending", "Accepted", "Declined", name="invitationstatusenum"), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table("project_invitations")
+    op.drop_table("project_memberships")
+    op.drop_table("comments")
+    op.drop_table("tasks")
+    op.drop_table("projects")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
+    sa.Enum(name="invitationstatusenum").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="taskstatusenum").drop(op.get_bind(), checkfirst=True)
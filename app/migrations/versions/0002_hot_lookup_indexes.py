@@ -0,0 +1,46 @@
+"""indexes for the hot crud lookups and unique project membership
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # keep the oldest membership row per (project, user) before enforcing uniqueness
+    op.execute(
+        """
+        DELETE FROM project_memberships
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM project_memberships GROUP BY project_id, user_id
+        )
+        """
+    )
+    op.create_index("ux_project_memberships_project_user", "project_memberships", ["project_id", "user_id"], unique=True, if_not_exists=True)
+    op.create_index("ix_project_memberships_user_id", "project_memberships", ["user_id"], if_not_exists=True)
+    op.create_index("ix_projects_owner_id", "projects", ["owner_id"], if_not_exists=True)
+    op.create_index("ix_tasks_project_id", "tasks", ["project_id"], if_not_exists=True)
+    op.create_index("ix_tasks_parent_task_id", "tasks", ["parent_task_id"], if_not_exists=True)
+    op.create_index("ix_tasks_assigned_to_id", "tasks", ["assigned_to_id"], if_not_exists=True)
+    op.create_index("ix_project_invitations_invitee_status", "project_invitations", ["invitee_id", "status"], if_not_exists=True)
+    op.create_index("ix_project_invitations_project_invitee", "project_invitations", ["project_id", "invitee_id"], if_not_exists=True)
+    op.create_index("ix_comments_task_id", "comments", ["task_id"], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_comments_task_id", table_name="comments")
+    op.drop_index("ix_project_invitations_project_invitee", table_name="project_invitations")
+    op.drop_index("ix_project_invitations_invitee_status", table_name="project_invitations")
+    op.drop_index("ix_tasks_assigned_to_id", table_name="tasks")
+    op.drop_index("ix_tasks_parent_task_id", table_name="tasks")
+    op.drop_index("ix_tasks_project_id", table_name="tasks")
+    op.drop_index("ix_projects_owner_id", table_name="projects")
+    op.drop_index("ix_project_memberships_user_id", table_name="project_memberships")
+    op.drop_index("ux_project_memberships_project_user", table_name="project_memberships")
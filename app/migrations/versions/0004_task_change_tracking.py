@@ -0,0 +1,37 @@
+"""task change versions and tombstones for delta sync
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.add_column(sa.Column("change_version", sa.Integer(), nullable=False, server_default="0"))
+    op.create_index("ix_tasks_project_change_version", "tasks", ["project_id", "change_version"])
+    op.create_table(
+        "task_tombstones",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("project_id", sa.String(), sa.ForeignKey("projects.id"), nullable=False),
+        sa.Column("task_id", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_task_tombstones_project_version", "task_tombstones", ["project_id", "version"])
+
+
+def downgrade():
+    op.drop_index("ix_task_tombstones_project_version", table_name="task_tombstones")
+    op.drop_table("task_tombstones")
+    op.drop_index("ix_tasks_project_change_version", table_name="tasks")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("change_version")
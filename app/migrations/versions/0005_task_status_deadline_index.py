@@ -0,0 +1,21 @@
+"""index for the overdue sweeper
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_tasks_status_deadline", "tasks", ["status", "deadline"])
+
+
+def downgrade():
+    op.drop_index("ix_tasks_status_deadline", table_name="tasks")
@@ -0,0 +1,44 @@
+"""per-project task summary rows
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "project_task_summaries",
+        sa.Column("project_id", sa.String(), sa.ForeignKey("projects.id"), primary_key=True),
+        sa.Column(
+            "status",
+            # the type already exists on Postgres (tasks.status)
+            postgresql.ENUM(
+                "New", "InProgress", "UnderReview", "Completed", "Overdue", name="taskstatusenum", create_type=False
+            ),
+            primary_key=True,
+        ),
+        sa.Column("assignee_id", sa.String(), primary_key=True),
+        sa.Column("task_count", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_tasks_project_deadline", "tasks", ["project_id", "deadline"])
+    op.execute(
+        "INSERT INTO project_task_summaries (project_id, status, assignee_id, task_count) "
+        "SELECT project_id, COALESCE(status, 'New'), COALESCE(assigned_to_id, ''), COUNT(*) "
+        "FROM tasks WHERE project_id IS NOT NULL "
+        "GROUP BY project_id, COALESCE(status, 'New'), COALESCE(assigned_to_id, '')"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_tasks_project_deadline", table_name="tasks")
+    op.drop_table("project_task_summaries")
@@ -0,0 +1,30 @@
+"""keyset index for comment threads and denormalized task comment counts
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.add_column(sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"))
+    op.execute("UPDATE tasks SET comment_count = (SELECT COUNT(*) FROM comments WHERE comments.task_id = tasks.id)")
+    op.create_index("ix_comments_task_created", "comments", ["task_id", "created_at", "id"])
+    # a prefix of the new index
+    op.drop_index("ix_comments_task_id", table_name="comments")
+
+
+def downgrade():
+    op.create_index("ix_comments_task_id", "comments", ["task_id"])
+    op.drop_index("ix_comments_task_created", table_name="comments")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("comment_count")
@@ -0,0 +1,42 @@
+"""full-text search indexes on tasks and comments
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+from app.models.fulltext import postgres_ddl, sqlite_ddl
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+INDEXED = {"tasks": {"name": "A", "description": "B"}, "comments": {"text": "A"}}
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    for table, weights in INDEXED.items():
+        if dialect == "postgresql":
+            # the generated column is computed for existing rows by the ALTER itself
+            for statement in postgres_ddl(table, weights):
+                op.execute(statement)
+        elif dialect == "sqlite":
+            for statement in sqlite_ddl(table, list(weights)):
+                op.execute(statement)
+            op.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    for table in INDEXED:
+        if dialect == "postgresql":
+            op.execute(f"DROP INDEX ix_{table}_search")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN search_vector")
+        elif dialect == "sqlite":
+            for trigger in ("insert", "delete", "update"):
+                op.execute(f"DROP TRIGGER {table}_fts_{trigger}")
+            op.execute(f"DROP TABLE {table}_fts")
@@ -0,0 +1,24 @@
+"""widen the project/deadline index for the timeline window
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # still serves the (project_id, deadline) prefix the summary counts use
+    op.create_index("ix_tasks_project_timeline", "tasks", ["project_id", "deadline", "created_at"])
+    op.drop_index("ix_tasks_project_deadline", table_name="tasks")
+
+
+def downgrade():
+    op.create_index("ix_tasks_project_deadline", "tasks", ["project_id", "deadline"])
+    op.drop_index("ix_tasks_project_timeline", table_name="tasks")
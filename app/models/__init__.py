@@ -4,3 +4,5 @@ from .project_membership import ProjectMembership
 from .comment import Comment
 from .user import User
 from .project_invitation import ProjectInvitation, InvitationStatusEnum
+from .task_tombstone import TaskTombstone
+from .project_task_summary import ProjectTaskSummary
@@ -1,11 +1,16 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
+from app.models.fulltext import register_fulltext
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # a task's thread in keyset order; also serves plain task_id lookups
+        Index("ix_comments_task_created", "task_id", "created_at", "id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     text = Column(String, nullable=False)
@@ -16,3 +21,6 @@ class Comment(Base):
 
     task_id = Column(String, ForeignKey("tasks.id"))
     task = relationship("Task", back_populates="comments")
+
+
+register_fulltext(Comment.__table__, {"text": "A"})
@@ -0,0 +1,49 @@
+"""Full-text indexes behind GET /search, created together with their tables.
+
+Postgres gets a generated ``search_vector`` tsvector column with a GIN index;
+SQLite an external-content FTS5 table ``<table>_fts`` kept in sync by
+triggers. Either way the index follows every write path, bulk executemany and
+Core UPDATEs included, without crud having to remember it.
+"""
+from sqlalchemy import DDL, event
+
+# language-neutral: lowercases and splits, no stemming (task text is mixed Russian/English)
+TS_CONFIG = "simple"
+
+
+def sqlite_ddl(table: str, columns) -> list:
+    fts = f"{table}_fts"
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', content_rowid='rowid', "
+        f"tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new}); END",
+        f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old}); END",
+        f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {names} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old}); "
+        f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new}); END",
+    ]
+
+
+def postgres_ddl(table: str, weights: dict) -> list:
+    vector = " || ".join(
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weights.items()
+    )
+    return [
+        f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX ix_{table}_search ON {table} USING GIN (search_vector)",
+    ]
+
+
+def register_fulltext(table, weights: dict):
+    """Create the index for ``table`` after the table itself; ``weights`` maps column -> 'A'..'D'."""
+    for statement in sqlite_ddl(table.name, list(weights)):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in postgres_ddl(table.name, weights):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    event.listen(table, "before_drop", DDL(f"DROP TABLE IF EXISTS {table.name}_fts").execute_if(dialect="sqlite"))
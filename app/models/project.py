@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -10,8 +10,10 @@ class Project(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String, nullable=False)
     final_deadline = Column(DateTime, nullable=True)
+    # bumped by every crud write to the project, its tasks, memberships or invitations (ETag source)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
-    owner_id = Column(String, ForeignKey("users.id"), nullable=True)
+    owner_id = Column(String, ForeignKey("users.id"), nullable=True, index=True)
     owner = relationship("User", back_populates="owned_projects")
 
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
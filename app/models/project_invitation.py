@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, String, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -11,6 +11,10 @@ class InvitationStatusEnum(str, enum.Enum):
 
 class ProjectInvitation(Base):
     __tablename__ = "project_invitations"
+    __table_args__ = (
+        Index("ix_project_invitations_invitee_status", "invitee_id", "status"),
+        Index("ix_project_invitations_project_invitee", "project_id", "invitee_id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     project_id = Column(String, ForeignKey("projects.id"), nullable=False)
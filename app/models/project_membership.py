@@ -1,13 +1,16 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 class ProjectMembership(Base):
     __tablename__ = "project_memberships"
+    __table_args__ = (
+        Index("ux_project_memberships_project_user", "project_id", "user_id", unique=True),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id"))
+    user_id = Column(String, ForeignKey("users.id"), index=True)
     project_id = Column(String, ForeignKey("projects.id"))
     role = Column(String, default="member")  # "member" or "leader"
 
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, ForeignKey, Integer, Enum as SAEnum
+from app.database import Base
+from app.models.task import TaskStatusEnum
+
+class ProjectTaskSummary(Base):
+    """Task count per (project, status, assignee), kept up to date by the crud task writes."""
+    __tablename__ = "project_task_summaries"
+
+    project_id = Column(String, ForeignKey("projects.id"), primary_key=True)
+    status = Column(SAEnum(TaskStatusEnum), primary_key=True)
+    # "" for unassigned tasks: NULL would never match in the upsert's conflict target
+    assignee_id = Column(String, primary_key=True, default="")
+    task_count = Column(Integer, nullable=False, default=0)
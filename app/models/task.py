@@ -1,8 +1,9 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Index, Enum as SAEnum
 from sqlalchemy.orm import relationship, backref
 from datetime import datetime
 from app.database import Base
+from app.models.fulltext import register_fulltext
 import enum
 
 class TaskStatusEnum(str, enum.Enum):
@@ -13,8 +14,20 @@ class TaskStatusEnum(str, enum.Enum):
     Overdue = "Overdue"
 
 
+# statuses the overdue sweeper may still flip to Overdue
+OPEN_TASK_STATUSES = (TaskStatusEnum.New, TaskStatusEnum.InProgress, TaskStatusEnum.UnderReview)
+
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_project_change_version", "project_id", "change_version"),
+        # overdue sweep: open statuses with a deadline in the past
+        Index("ix_tasks_status_deadline", "status", "deadline"),
+        # "due this week" counts on the project summary; created_at lets the
+        # timeline window filter (and its deadline IS NULL branch) stay in the index
+        Index("ix_tasks_project_timeline", "project_id", "deadline", "created_at"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String, nullable=False)
@@ -23,11 +36,15 @@ class Task(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     status = Column(SAEnum(TaskStatusEnum), default=TaskStatusEnum.New)
+    # Project.version of the last write to this row; delta sync cursor
+    change_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # kept by crud.create_comment so task lists need no join or COUNT
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
 
-    project_id = Column(String, ForeignKey("projects.id"), nullable=True)
+    project_id = Column(String, ForeignKey("projects.id"), nullable=True, index=True)
     project = relationship("Project", back_populates="tasks")
 
-    parent_task_id = Column(String, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True)
+    parent_task_id = Column(String, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=True, index=True)
     parent_task = relationship(
         "Task",
         remote_side=[id],
@@ -35,7 +52,10 @@ class Task(Base):
         passive_deletes=True,
     )
 
-    assigned_to_id = Column(String, ForeignKey("users.id"), nullable=True)
+    assigned_to_id = Column(String, ForeignKey("users.id"), nullable=True, index=True)
     assigned_to = relationship("User", back_populates="tasks_assigned")
 
     comments = relationship("Comment", back_populates="task", cascade="all, delete-orphan")
+
+
+register_fulltext(Task.__table__, {"name": "A", "description": "B"})
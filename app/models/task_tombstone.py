@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Index
+from datetime import datetime
+from app.database import Base
+
+class TaskTombstone(Base):
+    """A task id that left a project (deleted or moved away), reported by delta sync."""
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_project_version", "project_id", "version"),
+    )
+
+    # integer key: tombstones are written with INSERT ... FROM SELECT over a whole subtree
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(String, ForeignKey("projects.id"), nullable=False)
+    task_id = Column(String, nullable=False)
+    version = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow)
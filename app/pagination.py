@@ -0,0 +1,41 @@
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _non_negative_int(cursor: str) -> int:
+    try:
+        value = int(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if value < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return value
+
+
+def decode_sync_cursor(cursor: str) -> int:
+    # delta sync cursors are project versions; kept as opaque strings in the API
+    return _non_negative_int(cursor)
+
+
+def decode_offset_cursor(cursor: str, max_offset: int) -> int:
+    # ranked results (search) have no stable key to seek from, so their cursor is an offset
+    offset = _non_negative_int(cursor)
+    if offset > max_offset:
+        raise HTTPException(status_code=400, detail="Cursor is too deep; refine the query")
+    return offset
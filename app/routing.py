@@ -0,0 +1,113 @@
+import functools
+import inspect
+
+from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from sqlalchemy.orm import Session
+
+from app.config import DATABASE_ASYNC
+from app.database import LAST_WRITE_HEADER
+from app.unit_of_work import unit_of_work
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def run_in_session(func, response_model=None):
+    """Run a sync endpoint or dependency on the request's AsyncSession.
+
+    In async mode ``get_db`` yields an AsyncSession; the wrapped function is
+    executed through ``AsyncSession.run_sync`` so the existing crud code
+    awaits the driver on the event loop instead of holding a threadpool
+    worker. The response model is validated inside the same greenlet so
+    lazy loads during serialization still work. In sync mode this is a no-op.
+    """
+    if not DATABASE_ASYNC or inspect.iscoroutinefunction(func):
+        return func
+    if "db" not in inspect.signature(func).parameters:
+        return func
+
+    adapter = None
+    if response_model is not None:
+        from pydantic import TypeAdapter
+
+        adapter = TypeAdapter(response_model)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        def call(session):
+            result = func(*args, **{**kwargs, "db": session})
+            if adapter is not None and not isinstance(result, Response):
+                result = adapter.validate_python(result, from_attributes=True)
+            return result
+
+        return await kwargs["db"].run_sync(call)
+
+    return wrapper
+
+
+async def call_db(db, func, *args, **kwargs):
+    """Call sync ``func(db, *args)`` from an async endpoint without blocking the event loop."""
+    if DATABASE_ASYNC:
+        return await db.run_sync(func, *args, **kwargs)
+    return await run_in_threadpool(func, db, *args, **kwargs)
+
+
+def commit_on_success(func):
+    """Commit the request's session once after a write endpoint returns.
+
+    crud functions only flush; an endpoint that raises rolls everything back.
+    """
+    if "db" not in inspect.signature(func).parameters:
+        return func
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            await call_db(kwargs["db"], Session.commit)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with unit_of_work(kwargs["db"]):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class SessionRoute(APIRoute):
+    def __init__(self, path: str, endpoint, **kwargs):
+        response_model = kwargs.get("response_model")
+        if isinstance(response_model, DefaultPlaceholder):
+            response_model = None
+        if WRITE_METHODS & set(kwargs.get("methods") or ()):
+            endpoint = commit_on_success(endpoint)
+        endpoint = run_in_session(endpoint, response_model)
+        super().__init__(path, endpoint, **kwargs)
+
+
+class LastWriteMiddleware:
+    """Send the read-your-writes marker set by ``database.mark_write`` as ``X-Last-Write``.
+
+    The frontend stores it and sends it back on every request; see ``ReplicaRouter``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        async def send_with_marker(message):
+            last_write = scope.get("state", {}).get("last_write")
+            if message["type"] == "http.response.start" and last_write is not None:
+                message["headers"] = [*message.get("headers", []), (LAST_WRITE_HEADER.lower().encode(), f"{last_write:.3f}".encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from pydantic import BaseModel, EmailStr, Field
+from typing import Dict, Optional, List
 from datetime import datetime
 from app.models.task import TaskStatusEnum
 
@@ -58,14 +58,111 @@ class TaskRead(BaseModel):
     assigned_to_id: Optional[str]
     parent_task_id: Optional[str] = None
     created_at: Optional[datetime] = None
+    comment_count: int = 0
     assigned_to: Optional[UserRead] = None
 
     class Config:
         orm_mode = True
 
+class TaskSyncRead(BaseModel):
+    cursor: str
+    tasks: List[TaskRead]
+    deleted: List[str]
+
 class TaskStatusUpdate(BaseModel):
     status: TaskStatusEnum
 
+class TaskMove(BaseModel):
+    parent_task_id: Optional[str] = None
+
+class TaskBulkCreateItem(BaseModel):
+    ref: Optional[str] = None  # client id that other rows in the batch can use as parent_ref
+    name: str
+    description: Optional[str] = None
+    deadline: Optional[datetime] = None
+    parent_task_id: Optional[str] = None
+    parent_ref: Optional[str] = None
+    assigned_to_id: Optional[str] = None
+
+class TaskBulkCreate(BaseModel):
+    tasks: List[TaskBulkCreateItem]
+
+class TaskBulkUpdateItem(BaseModel):
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    deadline: Optional[datetime] = None
+    status: Optional[TaskStatusEnum] = None
+    parent_task_id: Optional[str] = None
+    assigned_to_id: Optional[str] = None
+
+class TaskBulkUpdate(BaseModel):
+    tasks: List[TaskBulkUpdateItem]
+
+class TaskBulkResult(BaseModel):
+    index: int
+    ref: Optional[str] = None
+    id: Optional[str] = None
+    ok: bool
+    detail: Optional[str] = None
+
+class TaskBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[TaskBulkResult]
+
+class ProjectScheduleRead(BaseModel):
+    """Columnar: the i-th entry of every per-task list describes the same task."""
+
+    project_id: str
+    final_deadline: Optional[int]  # epoch seconds
+    critical_chain: List[str]  # task ids, root to leaf
+    ids: List[str]
+    parent: List[int]  # index into ids; -1 for a root
+    latest_start: List[Optional[int]]  # epoch seconds
+    latest_finish: List[Optional[int]]
+    slack: List[Optional[int]]  # seconds; negative means planned too late
+
+class AssigneeWorkloadRead(BaseModel):
+    user: Optional[UserRead]  # None for unassigned tasks
+    total: int
+    open: int
+    by_status: Dict[str, int]
+
+class ProjectSummaryRead(BaseModel):
+    project_id: str
+    total: int
+    by_status: Dict[str, int]
+    due_this_week: int
+    week_start: datetime
+    week_end: datetime
+    workload: List[AssigneeWorkloadRead]
+
+class ProjectTimelineRead(BaseModel):
+    """Columnar: the i-th entry of every per-task list describes the same task."""
+
+    project_id: str
+    window_from: int = Field(..., alias="from")  # epoch seconds
+    window_to: int = Field(..., alias="to")
+    statuses: List[str]
+    ids: List[str]
+    names: List[str]
+    start: List[Optional[int]]  # created_at, epoch seconds
+    end: List[Optional[int]]  # deadline, epoch seconds
+    status: List[int]  # index into statuses
+    parent: List[int]  # index into ids; -1 root, -2 parent outside the window
+    assignee: List[int]  # index into assignees; -1 unassigned
+    assignees: List[UserRead]
+
+
+class SearchResult(BaseModel):
+    type: str  # "task" or "comment"
+    id: str
+    task_id: str
+    project_id: str
+    name: str  # the task's name, also for comment hits
+    text: Optional[str] = None
+    rank: float
 
 class CommentCreate(BaseModel):
     text: str
@@ -103,6 +200,21 @@ class ProjectInvitationCreate(BaseModel):
     invitee_email: EmailStr
     role: Optional[str] = "member"
 
+class ProjectInvitationBulkCreate(BaseModel):
+    invitations: List[ProjectInvitationCreate]
+
+class InvitationBulkResult(BaseModel):
+    index: int
+    invitee_email: str
+    id: Optional[str] = None
+    ok: bool
+    detail: Optional[str] = None
+
+class InvitationBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[InvitationBulkResult]
+
 class ProjectInvitationRead(BaseModel):
     id: str
     project_id: str
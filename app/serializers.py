@@ -0,0 +1,55 @@
+"""Fast path for list responses: plain dicts + orjson instead of orm_mode validation.
+
+The field tuples mirror the *Read schemas in app/schemas.py key for key, so the
+JSON shape stays the same (naive ISO datetimes, enums as their values).
+"""
+from operator import attrgetter
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def compile_serializer(fields, **nested):
+    """Build obj -> dict for `fields`; keyword args are serializers for nested objects (None stays None)."""
+    names = tuple(fields)
+    get = attrgetter(*names)
+    nested_items = tuple(nested.items())
+
+    def serialize(obj):
+        item = dict(zip(names, get(obj)))
+        for name, inner in nested_items:
+            value = getattr(obj, name)
+            item[name] = None if value is None else inner(value)
+        return item
+
+    return serialize
+
+
+user = compile_serializer(("id", "email", "first_name", "last_name"))
+# TaskRead without the nested assignee; used for change-feed events
+task = compile_serializer(
+    (
+        "id", "name", "description", "deadline", "status", "project_id", "assigned_to_id", "parent_task_id",
+        "created_at", "comment_count",
+    )
+)
+project = compile_serializer(("id", "name", "final_deadline", "owner_id"), owner=user)
+membership = compile_serializer(("id", "role"), user=user)
+comment = compile_serializer(("id", "text", "created_at", "author_id", "task_id"))
+invitation = compile_serializer(
+    ("id", "project_id", "inviter_id", "invitee_id", "role", "status"),
+    inviter=user,
+    invitee=user,
+    project=project,
+)
+
+
+def many(serializer, objects, headers=None):
+    return FastJSONResponse([serializer(obj) for obj in objects], headers=headers)
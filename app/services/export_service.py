@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+
+from sqlalchemy import select
+
+from app import models
+from app.database import SessionLocal
+
+EXPORT_COLUMNS = (
+    models.Task.id,
+    models.Task.name,
+    models.Task.description,
+    models.Task.deadline,
+    models.Task.status,
+    models.Task.project_id,
+    models.Task.parent_task_id,
+    models.Task.assigned_to_id,
+    models.Task.created_at,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+EXPORT_BATCH_SIZE = 1000
+
+
+def _plain(value):
+    if value is None:
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return value
+
+
+def iter_task_rows(project_id: str, batch_size: int = EXPORT_BATCH_SIZE):
+    """Yield task rows through a server-side cursor on a session owned by the stream.
+
+    The request's session is closed once the handler returns, so the stream
+    opens its own and holds at most ``batch_size`` rows at a time.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            select(*EXPORT_COLUMNS)
+            .where(models.Task.project_id == project_id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        for partition in result.partitions():
+            yield partition
+    finally:
+        db.close()
+
+
+def ndjson_stream(project_id: str):
+    for partition in iter_task_rows(project_id):
+        yield "".join(
+            json.dumps({field: _plain(value) for field, value in zip(EXPORT_FIELDS, row)}, ensure_ascii=False) + "\n"
+            for row in partition
+        )
+
+
+def csv_stream(project_id: str):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for partition in iter_task_rows(project_id):
+        for row in partition:
+            writer.writerow(["" if value is None else _plain(value) for value in row])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+
+from fastapi.concurrency import run_in_threadpool
+
+from app import crud, metrics
+from app.config import OVERDUE_SWEEP_BATCH_SIZE, OVERDUE_SWEEP_INTERVAL_SECONDS, OVERDUE_SWEEP_MAX_SECONDS
+from app.database import SessionLocal
+from app.unit_of_work import unit_of_work
+
+logger = logging.getLogger(__name__)
+
+
+class OverdueSweeper:
+    """Periodically marks open tasks past their deadline as Overdue.
+
+    Each batch is one short transaction of at most ``batch_size`` rows, so
+    row locks are held briefly; a run stops starting batches after
+    ``max_seconds`` and leaves the rest to the next run.
+    """
+
+    def __init__(
+        self,
+        interval: float = OVERDUE_SWEEP_INTERVAL_SECONDS,
+        batch_size: int = OVERDUE_SWEEP_BATCH_SIZE,
+        max_seconds: float = OVERDUE_SWEEP_MAX_SECONDS,
+    ):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_seconds = max_seconds
+        self.runs = 0
+        self.total_rows = 0
+        self.last_run = None
+        self._lock = threading.Lock()
+
+    def sweep(self, now: datetime = None) -> int:
+        now = now or datetime.utcnow()
+        start = time.perf_counter()
+        rows = batches = 0
+        error = None
+        try:
+            with SessionLocal() as db:
+                while True:
+                    with unit_of_work(db):
+                        count = crud.mark_overdue_tasks(db, now, self.batch_size)
+                    rows += count
+                    batches += 1
+                    if count < self.batch_size or time.perf_counter() - start >= self.max_seconds:
+                        break
+        except Exception as exc:
+            error = repr(exc)
+            raise
+        finally:
+            with self._lock:
+                self.runs += 1
+                self.total_rows += rows
+                self.last_run = {
+                    "at": now.isoformat(),
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                    "rows": rows,
+                    "batches": batches,
+                    "error": error,
+                }
+        return rows
+
+    async def run(self):
+        while True:
+            try:
+                await run_in_threadpool(self.sweep)
+            except Exception:
+                logger.exception("overdue sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Schedule the sweep loop on the running event loop; returns the task, or None when disabled."""
+        if self.interval <= 0:
+            return None
+        return asyncio.get_running_loop().create_task(self.run())
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "interval_seconds": self.interval,
+                "batch_size": self.batch_size,
+                "runs": self.runs,
+                "total_rows": self.total_rows,
+                "last_run": self.last_run,
+            }
+
+
+overdue_sweeper = OverdueSweeper()
+metrics.register("overdue_sweeper", overdue_sweeper.stats)
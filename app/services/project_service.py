@@ -1,5 +1,8 @@
+import uuid
+
 from sqlalchemy.orm import Session
-from app import crud
+from app import crud, models
+from app.unit_of_work import transactional
 
 class ProjectService:
     def create(self, db: Session, name: str, owner_id: str = None, final_deadline=None):
@@ -20,3 +23,64 @@ class ProjectService:
 
     def set_role(self, db: Session, membership_id: str, new_role: str):
         return crud.set_membership_role(db, membership_id, new_role)
+
+    @transactional
+    def bulk_invite(self, db: Session, project_id: str, inviter_id: str, items: list):
+        """Invite many users at once with the same rules as the single invitation endpoint.
+
+        Users, existing memberships and pending invitations are resolved with
+        three IN queries for the whole batch, and the valid invitations are
+        inserted in a single transaction.
+        """
+        count = len(items)
+        errors = [None] * count
+        first_index = {}
+        for index, item in enumerate(items):
+            if item.invitee_email in first_index:
+                errors[index] = "Duplicate email in request"
+            else:
+                first_index[item.invitee_email] = index
+
+        user_ids = crud.get_user_ids_by_email(db, first_index)
+        candidates = set(user_ids.values())
+        members = crud.list_member_user_ids(db, project_id, candidates) if candidates else set()
+        pending = crud.list_pending_invitee_ids(db, project_id, candidates) if candidates else set()
+
+        ids = [None] * count
+        rows = []
+        for index, item in enumerate(items):
+            if errors[index]:
+                continue
+            invitee_id = user_ids.get(item.invitee_email)
+            if not invitee_id:
+                errors[index] = "User not found"
+            elif invitee_id in members:
+                errors[index] = "User is already a member of the project"
+            elif invitee_id in pending:
+                errors[index] = "Invitation already sent"
+            elif invitee_id == inviter_id:
+                errors[index] = "Cannot invite yourself"
+            else:
+                ids[index] = str(uuid.uuid4())
+                rows.append({
+                    "id": ids[index],
+                    "project_id": project_id,
+                    "inviter_id": inviter_id,
+                    "invitee_id": invitee_id,
+                    "role": item.role,
+                    "status": models.InvitationStatusEnum.Pending,
+                })
+        if rows:
+            crud.bulk_create_invitations(db, project_id, rows)
+
+        results = [
+            {
+                "index": index,
+                "invitee_email": item.invitee_email,
+                "id": ids[index],
+                "ok": ids[index] is not None,
+                "detail": errors[index],
+            }
+            for index, item in enumerate(items)
+        ]
+        return {"succeeded": len(rows), "failed": count - len(rows), "results": results}
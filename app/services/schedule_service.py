@@ -0,0 +1,217 @@
+from datetime import datetime
+
+import orjson
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import get_history
+
+from app import metrics, models
+from app.cache import LRUCache
+from app.config import SCHEDULE_CACHE_SIZE
+from app.unit_of_work import on_commit
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def epoch_seconds(db: Session, column):
+    """SQL expression for a naive UTC datetime column as epoch seconds."""
+    if db.get_bind().dialect.name == "sqlite":
+        return (func.julianday(column) - 2440587.5) * 86400.0
+    return func.extract("epoch", column)
+
+
+def to_epoch(value: datetime):
+    return None if value is None else (value - EPOCH).total_seconds()
+
+
+def compute_schedule(final_deadline, tasks):
+    """Plan a task tree backwards from ``final_deadline``.
+
+    ``tasks`` is an iterable of ``(id, parent_id, created_at, deadline)``
+    tuples with times as epoch seconds. Subtasks have to be finished before
+    their parent's own work starts, and that work is the gap between the
+    latest subtask deadline and the parent's deadline (for a leaf, the gap
+    since it was created). Root tasks must finish by the final deadline.
+
+    Returns ``(columns, critical_chain)``. ``columns`` holds parallel lists in
+    input order: ``ids``, ``parent`` (index of the parent, -1 for a root),
+    ``latest_start``, ``latest_finish`` and ``slack``, the latest finish minus
+    the task's own deadline (negative means it is planned too late).
+    ``critical_chain`` is the root-to-leaf ids that always follow the subtask
+    with the least slack. Runs in O(n); tasks whose parent is outside the tree
+    are roots and cycles are broken at an arbitrary node.
+
+    Only flat lists of strings and numbers outlive the call, so a large tree
+    does not leave the cyclic collector hundreds of thousands of containers
+    to sweep: rows are consumed one at a time (``tasks`` may be a DB result)
+    and children are kept as offsets into one shared list.
+    """
+    ids, parent_ids, created, deadlines = [], [], [], []
+    for task_id, parent_id, created_at, deadline in tasks:
+        ids.append(task_id)
+        parent_ids.append(parent_id)
+        created.append(created_at)
+        deadlines.append(deadline)
+    count = len(ids)
+    index_of = {task_id: index for index, task_id in enumerate(ids)}
+    get_index = index_of.get
+    parents = [-1 if parent_id is None else get_index(parent_id, -1) for parent_id in parent_ids]
+
+    # children of i are child_list[child_start[i]:child_start[i + 1]]
+    child_start = [0] * (count + 1)
+    latest_child_deadline = [None] * count
+    roots = []
+    for index, parent, deadline in zip(range(count), parents, deadlines):
+        if parent < 0:
+            roots.append(index)
+            continue
+        child_start[parent + 1] += 1
+        if deadline is not None:
+            current = latest_child_deadline[parent]
+            if current is None or deadline > current:
+                latest_child_deadline[parent] = deadline
+    for index in range(count):
+        child_start[index + 1] += child_start[index]
+    child_list = [0] * (count - len(roots))
+    fill = child_start[:count]
+    for index, parent in enumerate(parents):
+        if parent >= 0:
+            child_list[fill[parent]] = index
+            fill[parent] += 1
+    del fill
+
+    latest_finish = [None] * count
+    latest_start = [None] * count
+    visited = [False] * count
+
+    def walk(root):
+        latest_finish[root] = final_deadline if final_deadline is not None else deadlines[root]
+        # breadth-first; the list grows while it is being iterated
+        order = [root]
+        extend = order.extend
+        for index in order:
+            if visited[index]:
+                continue
+            visited[index] = True
+            finish = latest_finish[index]
+            start = None
+            if finish is not None:
+                deadline = deadlines[index]
+                start = finish
+                if deadline is not None:
+                    work_from = latest_child_deadline[index]
+                    if work_from is None:
+                        work_from = created[index]
+                    if work_from is not None and deadline > work_from:
+                        start = finish - (deadline - work_from)
+            latest_start[index] = start
+            first, last = child_start[index], child_start[index + 1]
+            if first < last:
+                kids = child_list[first:last]
+                for child in kids:
+                    # a cycle leads back to its visited entry point
+                    if not visited[child]:
+                        latest_finish[child] = start
+                extend(kids)
+
+    for root in roots:
+        walk(root)
+    for index in range(count):
+        if not visited[index]:
+            roots.append(index)
+            walk(index)
+
+    slack = [
+        None if finish is None or deadline is None else finish - deadline
+        for finish, deadline in zip(latest_finish, deadlines)
+    ]
+
+    def tightest(candidates):
+        best = None
+        for index in candidates:
+            value = slack[index]
+            if value is not None and (best is None or value < slack[best]):
+                best = index
+        return best
+
+    chain = []
+    index = tightest(roots)
+    while index is not None and ids[index] not in chain:
+        chain.append(ids[index])
+        index = tightest(child_list[child_start[index]:child_start[index + 1]])
+    columns = {"ids": ids, "parent": parents, "latest_start": latest_start, "latest_finish": latest_finish, "slack": slack}
+    return columns, chain
+
+
+def _seconds(values):
+    # julianday() arithmetic leaves float noise; the payload is in whole seconds
+    return [None if value is None else round(value) for value in values]
+
+
+class ScheduleService:
+    def __init__(self, cache_size: int = SCHEDULE_CACHE_SIZE):
+        self.cache = LRUCache(maxsize=cache_size)
+
+    def get(self, db: Session, project: models.Project) -> bytes:
+        """The rendered JSON body, so a cache hit skips validation and serialization."""
+        # entries carry the Project.version they were built from: a reader that
+        # saw pre-commit rows (or a lagging replica) may store its result after
+        # the writer's invalidation, and must not serve it under the new ETag
+        version, body = self.cache.get(project.id, (None, None))
+        if body is None or version != project.version:
+            body = orjson.dumps(self.build(db, project))
+            self.cache.set(project.id, (project.version, body))
+        return body
+
+    def build(self, db: Session, project: models.Project) -> dict:
+        """Columnar like the timeline: the i-th entry of every list describes the same task."""
+        task_rows = db.execute(
+            select(
+                models.Task.id,
+                models.Task.parent_task_id,
+                epoch_seconds(db, models.Task.created_at),
+                epoch_seconds(db, models.Task.deadline),
+            ).where(models.Task.project_id == project.id)
+        )
+        final_deadline = to_epoch(project.final_deadline)
+        columns, chain = compute_schedule(final_deadline, task_rows)
+        return {
+            "project_id": project.id,
+            "final_deadline": None if final_deadline is None else round(final_deadline),
+            "critical_chain": chain,
+            "ids": columns["ids"],
+            "parent": columns["parent"],
+            "latest_start": _seconds(columns["latest_start"]),
+            "latest_finish": _seconds(columns["latest_finish"]),
+            "slack": _seconds(columns["slack"]),
+        }
+
+    def invalidate(self, project_id: str):
+        self.cache.delete(project_id)
+
+
+schedule_service = ScheduleService()
+metrics.register("schedule_cache", schedule_service.cache.stats)
+
+
+def _invalidate_on_commit(target, *project_ids):
+    # invalidating at flush time would let a concurrent read cache the old rows again
+    session = object_session(target)
+    if session is None:
+        for project_id in project_ids:
+            schedule_service.invalidate(project_id)
+        return
+    on_commit(session, lambda: [schedule_service.invalidate(project_id) for project_id in project_ids])
+
+
+@event.listens_for(models.Task, "after_insert")
+@event.listens_for(models.Task, "after_update")
+@event.listens_for(models.Task, "after_delete")
+def _task_changed(mapper, connection, target):
+    _invalidate_on_commit(target, target.project_id, *get_history(target, "project_id").deleted)
+
+
+@event.listens_for(models.Project, "after_update")
+@event.listens_for(models.Project, "after_delete")
+def _project_changed(mapper, connection, target):
+    _invalidate_on_commit(target, target.id)
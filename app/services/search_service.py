@@ -0,0 +1,95 @@
+import re
+
+from sqlalchemy import column, func, literal, literal_column, select, table, union_all
+from sqlalchemy.orm import Session
+
+from app import models
+from app.config import SEARCH_MAX_TERMS
+from app.models.fulltext import TS_CONFIG
+
+WORD = re.compile(r"\w+")
+
+
+def search_terms(q: str) -> list:
+    """Words of the query; punctuation and operators are dropped, so user input is never query syntax."""
+    return WORD.findall(q.lower())[:SEARCH_MAX_TERMS]
+
+
+def accessible_project_ids(user_id: str):
+    return select(models.Project.id).where(models.Project.owner_id == user_id).union(
+        select(models.ProjectMembership.project_id).where(models.ProjectMembership.user_id == user_id)
+    )
+
+
+class SearchService:
+    """Ranked full-text search over task names/descriptions and comment text.
+
+    All terms must match; the last one also matches as a prefix, so results
+    show up while the user is still typing. Postgres ranks with ts_rank over
+    the GIN-indexed tsvector, SQLite with bm25 over FTS5 (see
+    app/models/fulltext.py); task names weigh more than descriptions.
+    """
+
+    def search(self, db: Session, user_id: str, q: str, limit: int, offset: int = 0):
+        terms = search_terms(q)
+        if not terms:
+            return []
+        if db.get_bind().dialect.name == "sqlite":
+            task_hits, comment_hits = self._sqlite_hits(terms)
+        else:
+            task_hits, comment_hits = self._postgres_hits(terms)
+
+        projects = accessible_project_ids(user_id)
+        task_hits = task_hits.add_columns(
+            literal("task").label("type"),
+            models.Task.id,
+            models.Task.id.label("task_id"),
+            models.Task.project_id,
+            models.Task.name,
+            models.Task.description.label("text"),
+        ).where(models.Task.project_id.in_(projects))
+        comment_hits = comment_hits.add_columns(
+            literal("comment").label("type"),
+            models.Comment.id,
+            models.Comment.task_id,
+            models.Task.project_id,
+            models.Task.name,
+            models.Comment.text,
+        ).join(models.Task, models.Task.id == models.Comment.task_id).where(models.Task.project_id.in_(projects))
+
+        hits = union_all(task_hits, comment_hits).subquery()
+        rows = db.execute(
+            select(hits.c.type, hits.c.id, hits.c.task_id, hits.c.project_id, hits.c.name, hits.c.text, hits.c.rank)
+            .order_by(hits.c.rank.desc(), hits.c.type, hits.c.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return [dict(row._mapping) for row in rows]
+
+    def _sqlite_hits(self, terms):
+        match = " ".join(f'"{term}"' for term in terms) + "*"
+
+        def hits(model, weights):
+            fts = table(f"{model.__tablename__}_fts", column("rowid"))
+            fts_ref = literal_column(fts.name)
+            # bm25 is lower-is-better; negate it so both backends sort by rank descending
+            return (
+                select((-func.bm25(fts_ref, *weights)).label("rank"))
+                .select_from(fts)
+                .join(model, literal_column(f"{model.__tablename__}.rowid") == fts.c.rowid)
+                .where(fts_ref.op("MATCH")(match))
+            )
+
+        return hits(models.Task, (10.0, 1.0)), hits(models.Comment, (1.0,))
+
+    def _postgres_hits(self, terms):
+        query = func.to_tsquery(TS_CONFIG, " & ".join(f"'{term}'" for term in terms) + ":*")
+
+        def hits(model):
+            vector = literal_column(f"{model.__tablename__}.search_vector")
+            return select(func.ts_rank(vector, query).label("rank")).select_from(model).where(vector.op("@@")(query))
+
+        return hits(models.Task), hits(models.Comment)
+
+
+search_service = SearchService()
@@ -0,0 +1,174 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app import crud, models
+from app.models.task import TaskStatusEnum
+from app.unit_of_work import transactional
+
+
+def deadline_error(project: models.Project, deadline):
+    if project.final_deadline and deadline and deadline.date() > project.final_deadline.date():
+        return f"Task deadline cannot be later than project deadline ({project.final_deadline.strftime('%Y-%m-%d')})"
+    return None
+
+
+class TaskService:
+    @transactional
+    def bulk_create(self, db: Session, access: crud.ProjectAccess, current_user_id: str, items: list):
+        """Validate every row in one pass and insert the valid ones in a single transaction.
+
+        Rows can point at each other with ``ref``/``parent_ref``; they are
+        inserted parents-first, and a row whose in-batch parent failed fails too.
+        """
+        project = access.project
+        count = len(items)
+        allowed_assignees = crud.list_member_user_ids(db, project.id) | {project.owner_id}
+        existing = crud.get_task_rows(db, project.id, {item.parent_task_id for item in items if item.parent_task_id})
+
+        ref_index = {}
+        errors = [None] * count
+        for index, item in enumerate(items):
+            if item.ref is None:
+                continue
+            if item.ref in ref_index:
+                errors[index] = "Duplicate ref"
+            else:
+                ref_index[item.ref] = index
+
+        parent_index = [None] * count
+        for index, item in enumerate(items):
+            if errors[index]:
+                continue
+            if item.parent_ref is not None and item.parent_task_id:
+                errors[index] = "Use either parent_task_id or parent_ref"
+            elif item.parent_ref is not None and item.parent_ref not in ref_index:
+                errors[index] = "Unknown parent_ref"
+            elif item.parent_task_id and item.parent_task_id not in existing:
+                errors[index] = "Parent task not found in project"
+            elif item.assigned_to_id and item.assigned_to_id not in allowed_assignees:
+                errors[index] = "Assignee must be a project member or owner"
+            else:
+                errors[index] = deadline_error(project, item.deadline)
+            if item.parent_ref is not None:
+                parent_index[index] = ref_index.get(item.parent_ref)
+
+        # resolve in-batch parents so every row is inserted after its parent
+        created = [None] * count
+        order = []
+        for start in range(count):
+            path, on_path = [], set()
+            index = start
+            while index is not None and created[index] is None and index not in on_path:
+                path.append(index)
+                on_path.add(index)
+                index = parent_index[index]
+            if index is None:
+                parent_ok = True
+            elif created[index] is None:
+                for member in path[path.index(index):]:
+                    errors[member] = errors[member] or "Parent references form a cycle"
+                parent_ok = False
+            else:
+                parent_ok = created[index]
+            for index in reversed(path):
+                if parent_ok and not errors[index]:
+                    created[index] = True
+                    order.append(index)
+                else:
+                    errors[index] = errors[index] or "Parent row in this batch was not created"
+                    created[index] = False
+                    parent_ok = False
+
+        now = datetime.utcnow()
+        ids = [str(uuid.uuid4()) for _ in range(count)]
+        rows = []
+        for index in order:
+            item = items[index]
+            parent = parent_index[index]
+            rows.append({
+                "id": ids[index],
+                "name": item.name,
+                "description": item.description,
+                "deadline": item.deadline,
+                "project_id": project.id,
+                "parent_task_id": ids[parent] if parent is not None else item.parent_task_id,
+                "assigned_to_id": item.assigned_to_id or current_user_id,
+                "status": TaskStatusEnum.New,
+                "created_at": now,
+            })
+        if rows:
+            crud.bulk_insert_tasks(db, project.id, rows)
+
+        results = [
+            {
+                "index": index,
+                "ref": item.ref,
+                "id": ids[index] if created[index] else None,
+                "ok": bool(created[index]),
+                "detail": errors[index],
+            }
+            for index, item in enumerate(items)
+        ]
+        return {"succeeded": len(rows), "failed": count - len(rows), "results": results}
+
+    @transactional
+    def bulk_update(self, db: Session, access: crud.ProjectAccess, current_user_id: str, items: list):
+        """Apply the fields each row sets, with the same rules as the single-task endpoints."""
+        project = access.project
+        referenced = {item.id for item in items} | {item.parent_task_id for item in items if item.parent_task_id}
+        existing = crud.get_task_rows(db, project.id, referenced)
+        changes = [item.dict(exclude_unset=True) for item in items]
+
+        allowed_assignees = None
+        if any("assigned_to_id" in change for change in changes):
+            allowed_assignees = crud.list_member_user_ids(db, project.id) | {project.owner_id}
+        parent_of = None
+        if any(change.get("parent_task_id") for change in changes):
+            parent_of = crud.get_project_parent_map(db, project.id)
+
+        results, rows, seen = [], [], set()
+        for index, change in enumerate(changes):
+            task_id = change.pop("id")
+            error = None
+            if task_id in seen:
+                error = "Duplicate id"
+            elif task_id not in existing:
+                error = "Task not found in project"
+            else:
+                assigned_to_id, _ = existing[task_id]
+                if "name" in change and not change["name"]:
+                    error = "name cannot be empty"
+                elif "status" in change and change["status"] is None:
+                    error = "status cannot be null"
+                elif "assigned_to_id" in change and change["assigned_to_id"] != assigned_to_id and not access.is_owner_or_leader:
+                    error = "Only project owner or leader can reassign task"
+                elif change.get("assigned_to_id") and change["assigned_to_id"] not in allowed_assignees:
+                    error = "Assignee must be a project member or owner"
+                elif "status" in change and assigned_to_id != current_user_id and not access.is_owner_or_leader:
+                    error = "Only task owner or project owner/leader can change status"
+                elif change.get("parent_task_id"):
+                    error = self._parent_error(parent_of, existing, task_id, change["parent_task_id"])
+                error = error or deadline_error(project, change.get("deadline"))
+            seen.add(task_id)
+            if error is None:
+                if "parent_task_id" in change and parent_of is not None:
+                    parent_of[task_id] = change["parent_task_id"]
+                rows.append({"id": task_id, **change})
+            results.append({"index": index, "id": task_id, "ok": error is None, "detail": error})
+
+        if rows:
+            crud.bulk_update_tasks(db, project.id, rows)
+        return {"succeeded": len(rows), "failed": len(items) - len(rows), "results": results}
+
+    def _parent_error(self, parent_of: dict, existing: dict, task_id: str, parent_id: str):
+        if parent_id not in existing:
+            return "Parent task not found in project"
+        ancestor, steps = parent_id, 0
+        while ancestor is not None and steps <= len(parent_of):
+            if ancestor == task_id:
+                return "Cannot move a task under its own subtree"
+            ancestor = parent_of.get(ancestor)
+            steps += 1
+        return None
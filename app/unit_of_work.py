@@ -0,0 +1,65 @@
+"""One transaction per request.
+
+crud functions only ``flush``; a write is committed once, at the request or
+service boundary, by ``unit_of_work``. Nested blocks join the outer one, so a
+service method commits when called on its own (a script, the sweeper) but not
+when it runs inside a request. Process-wide caches must not be invalidated
+before the new data is visible to other sessions; they register the
+invalidation with ``on_commit`` instead.
+"""
+import functools
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@contextmanager
+def unit_of_work(db: Session):
+    """Commit once when the outermost block exits cleanly; roll back if it raises."""
+    depth = db.info.get("unit_of_work_depth", 0)
+    db.info["unit_of_work_depth"] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            db.commit()
+    except BaseException:
+        if depth == 0:
+            db.rollback()
+        raise
+    finally:
+        db.info["unit_of_work_depth"] = depth
+
+
+def transactional(method):
+    """Run a ``(self, db, ...)`` service method in a unit of work."""
+
+    @functools.wraps(method)
+    def wrapper(self, db: Session, *args, **kwargs):
+        with unit_of_work(db):
+            return method(self, db, *args, **kwargs)
+
+    return wrapper
+
+
+def on_commit(db: Session, callback):
+    """Call ``callback()`` after the outermost transaction commits; dropped on its rollback.
+
+    Savepoints (``begin_nested``) neither run nor drop the callbacks.
+    """
+    db.info.setdefault("on_commit", []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit(session):
+    if session.in_nested_transaction():
+        return
+    for callback in session.info.pop("on_commit", ()):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_on_commit(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop("on_commit", None)
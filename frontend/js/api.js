@@ -1,5 +1,6 @@
 const API_URL = "http://localhost:8000";
 const TOKEN_STORAGE_KEY = "token";
+const LAST_WRITE_STORAGE_KEY = "lastWrite";
 
 function getToken() {
     return localStorage.getItem(TOKEN_STORAGE_KEY);
@@ -13,12 +14,26 @@ function removeToken() {
     localStorage.removeItem(TOKEN_STORAGE_KEY);
 }
 
+// Маркер последней записи: пока он свежий, сервер читает наши данные с основной базы,
+// а не с отстающих реплик (на каком бы воркере ни оказался следующий запрос)
+function rememberLastWrite(response) {
+    const marker = response.headers.get("X-Last-Write");
+    if (marker) {
+        localStorage.setItem(LAST_WRITE_STORAGE_KEY, marker);
+    }
+}
+
+function getLastWrite() {
+    return localStorage.getItem(LAST_WRITE_STORAGE_KEY);
+}
+
 async function apiLogin(email, password) {
     const response = await fetch(`${API_URL}/login`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({ email, password })
     });
+    rememberLastWrite(response);
 
     const payload = await response.json().catch(() => null);
 
@@ -36,6 +51,7 @@ async function apiRegister(payload) {
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify(payload)
     });
+    rememberLastWrite(response);
 
     const data = await response.json().catch(() => null);
 
@@ -59,6 +75,10 @@ async function fetchWithAuth(path, options = {}) {
         Authorization: `Bearer ${token}`,
         ...customHeaders
     };
+    const lastWrite = getLastWrite();
+    if (lastWrite) {
+        fullHeaders["X-Last-Write"] = lastWrite;
+    }
 
     let serializedBody;
     if (body !== undefined) {
@@ -82,6 +102,7 @@ async function fetchWithAuth(path, options = {}) {
     }
 
     const response = await fetch(`${API_URL}${path}`, fetchOptions);
+    rememberLastWrite(response);
 
     if (response.status === 401) {
         removeToken();
@@ -145,6 +166,17 @@ async function fetchProjectTasks(projectId) {
     return payload;
 }
 
+function openProjectEvents(projectId) {
+    const token = getToken();
+    if (!token || typeof EventSource === "undefined") {
+        return null;
+    }
+    // EventSource не умеет передавать заголовки, поэтому токен идет в query
+    const lastWrite = getLastWrite();
+    const marker = lastWrite ? `&last_write=${encodeURIComponent(lastWrite)}` : "";
+    return new EventSource(`${API_URL}/projects/${encodeURIComponent(projectId)}/events?token=${encodeURIComponent(token)}${marker}`);
+}
+
 async function createTask(payload) {
     const { response, payload: data } = await fetchWithAuth("/tasks", {
         method: "POST",
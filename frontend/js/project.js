@@ -117,196 +117,329 @@ function formatDate(value) {
     });
 }
 
-function renderTasks(tasks) {
-    if (!taskList) return;
+// Список задач виртуализирован: в DOM только видимые строки (плюс запас),
+// строки закреплены за task.id и при изменениях патчатся на месте
+// Содержимое строки не переносится: длинные тексты обрезаются многоточием,
+// полный текст показывается во всплывающей подсказке (title)
+const TASK_ROW_HEIGHT = 152; // фиксированная высота строки + отступ mb-2
+const TASK_ROW_OVERSCAN = 5;
+const STATUS_OPTIONS = ["New", "InProgress", "UnderReview", "Completed"];
+
+const taskRows = new Map(); // task.id -> строка, отрисованная сейчас
+const taskTopSpacer = document.createElement("li");
+const taskBottomSpacer = document.createElement("li");
+taskTopSpacer.setAttribute("aria-hidden", "true");
+taskBottomSpacer.setAttribute("aria-hidden", "true");
+let renderedTasks = [];
+let tasksById = new Map();
+let taskListFrame = null;
+let membersVersion = 0;
+
+function applyStatusSelectStyle(selectEl, statusValue) {
+    const { color, textClass } = getStatusStyle(statusValue);
+    selectEl.className = `form-select form-select-sm w-auto bg-${color} ${textClass}`;
+}
+
+function fillParentOptions(select, task) {
+    // полный список задач строится только при открытии селектора, а не для каждой строки
+    select.innerHTML = "";
+    const noneOption = document.createElement("option");
+    noneOption.value = "";
+    noneOption.textContent = "Нет";
+    select.appendChild(noneOption);
+    const candidates = select.dataset.full ? loadedTasks : [tasksById.get(task.parent_task_id)].filter(Boolean);
+    candidates
+        .filter(t => t.id !== task.id)
+        .forEach(t => {
+            const opt = document.createElement("option");
+            opt.value = t.id;
+            opt.textContent = t.name || t.id;
+            select.appendChild(opt);
+        });
+    select.value = task.parent_task_id || "";
+}
+
+function fillAssigneeOptions(select) {
+    select.innerHTML = "";
+    const assigneeNone = document.createElement("option");
+    assigneeNone.value = "";
+    assigneeNone.textContent = "Не назначен";
+    select.appendChild(assigneeNone);
+    const assigneeList = projectOwnerAsMember ? [projectOwnerAsMember, ...loadedMembers] : loadedMembers;
+    assigneeList.forEach(m => {
+        const opt = document.createElement("option");
+        opt.value = m.user?.id || m.user_id;
+        opt.textContent = formatUserLabel(m.user, m.user_id);
+        select.appendChild(opt);
+    });
+}
+
+function applyTaskChange(updated) {
+    upsertTasks([updated]);
+    renderTasks(loadedTasks);
+}
+
+function syncSelectTitle(select) {
+    select.title = select.selectedOptions[0]?.textContent || "";
+}
+
+function createTaskRow() {
+    const row = { task: null, key: null, parentKey: null, membersVersion: -1 };
+
+    const li = document.createElement("li");
+    li.className = "list-group-item border-0 rounded-3 shadow-sm mb-2 overflow-hidden";
+    li.style.height = `${TASK_ROW_HEIGHT - 8}px`;
+
+    const titleRow = document.createElement("div");
+    titleRow.className = "d-flex justify-content-between align-items-center mb-1";
+
+    const title = document.createElement("h6");
+    title.className = "mb-0 text-truncate";
+    title.style.minWidth = "0";
+
+    const controls = document.createElement("div");
+    controls.className = "d-flex align-items-center gap-2 flex-shrink-0";
+
+    const statusSelect = document.createElement("select");
+    STATUS_OPTIONS.forEach(value => {
+        const o = document.createElement("option");
+        o.value = value;
+        o.textContent = STATUS_LABELS[value];
+        statusSelect.appendChild(o);
+    });
+    statusSelect.addEventListener("change", async (e) => {
+        const task = row.task;
+        const newStatus = e.target.value;
+        try {
+            applyTaskChange(await changeTaskStatus(task.id, newStatus));
+            showProjectAlert("Статус задачи обновлен.", "success");
+        } catch (err) {
+            showProjectAlert(err.message || "Не удалось изменить статус задачи.");
+            // вернуть предыдущее значение
+            statusSelect.value = task.status;
+        } finally {
+            applyStatusSelectStyle(statusSelect, statusSelect.value);
+        }
+    });
+
+    const badge = document.createElement("span");
+
+    const delBtn = document.createElement("button");
+    delBtn.className = "btn btn-sm btn-outline-danger";
+    delBtn.textContent = "Удалить";
+    delBtn.addEventListener("click", async () => {
+        try {
+            await window.deleteTask(row.task.id);
+            showProjectAlert("Задача удалена.", "success");
+            removeTaskSubtrees([row.task.id]);
+            refreshTaskViews();
+        } catch (err) {
+            showProjectAlert(err.message || "Не удалось удалить задачу.");
+        }
+    });
+
+    controls.append(statusSelect, badge, delBtn);
+    titleRow.append(title, controls);
+
+    const desc = document.createElement("p");
+    desc.className = "mb-1 text-muted small text-truncate";
 
-    const tasksById = tasks.reduce((acc, t) => {
-        acc[t.id] = t;
-        return acc;
-    }, {});
+    const meta = document.createElement("div");
+    meta.className = "d-flex flex-column gap-1 text-secondary small";
 
-    taskList.innerHTML = "";
+    const dates = document.createElement("div");
+    dates.className = "d-flex gap-3 text-nowrap overflow-hidden";
+
+    const deadline = document.createElement("span");
+    const created = document.createElement("span");
+
+    const parentSelect = document.createElement("select");
+    parentSelect.className = "form-select form-select-sm w-auto text-truncate";
+    parentSelect.style.minWidth = "0";
+    const loadParentOptions = () => {
+        if (parentSelect.dataset.full) return;
+        parentSelect.dataset.full = "true";
+        fillParentOptions(parentSelect, row.task);
+    };
+    parentSelect.addEventListener("focus", loadParentOptions);
+    parentSelect.addEventListener("mousedown", loadParentOptions);
+    parentSelect.addEventListener("change", async (e) => {
+        const task = row.task;
+        const newParentId = e.target.value || null;
+        try {
+            applyTaskChange(await updateTask(task.id, buildTaskUpdatePayload(task, newParentId)));
+            showProjectAlert("Родительская задача обновлена.", "success");
+        } catch (err) {
+            showProjectAlert(err.message || "Не удалось обновить задачу.");
+            // откатить визуально
+            parentSelect.value = task.parent_task_id || "";
+        }
+    });
+
+    // Родитель и исполнитель в одной строке
+    const rowWrapper = document.createElement("div");
+    rowWrapper.className = "d-flex align-items-center gap-3";
+
+    const parentWrapper = document.createElement("div");
+    parentWrapper.className = "d-flex align-items-center gap-2";
+    parentWrapper.style.minWidth = "0";
+    const parentLabel = document.createElement("span");
+    parentLabel.textContent = "Родительская задача:";
+    parentLabel.className = "text-secondary text-nowrap";
+    parentWrapper.append(parentLabel, parentSelect);
+
+    // Исполнитель
+    const assigneeSelect = document.createElement("select");
+    assigneeSelect.className = "form-select form-select-sm w-auto text-truncate";
+    assigneeSelect.style.minWidth = "0";
+    assigneeSelect.addEventListener("change", async (e) => {
+        const task = row.task;
+        const newAssigneeId = e.target.value || null;
+        try {
+            applyTaskChange(await updateTask(task.id, buildTaskUpdatePayload(task, task.parent_task_id, newAssigneeId)));
+            showProjectAlert("Исполнитель задачи обновлен.", "success");
+        } catch (err) {
+            showProjectAlert(err.message || "Не удалось обновить исполнителя.");
+            assigneeSelect.value = task.assigned_to_id || "";
+        }
+    });
+
+    const assigneeWrapper = document.createElement("div");
+    assigneeWrapper.className = "d-flex align-items-center gap-2";
+    assigneeWrapper.style.minWidth = "0";
+    const assigneeLabel = document.createElement("span");
+    assigneeLabel.textContent = "Исполнитель:";
+    assigneeLabel.className = "text-secondary text-nowrap";
+    assigneeWrapper.append(assigneeLabel, assigneeSelect);
+
+    rowWrapper.append(parentWrapper, assigneeWrapper);
+    dates.append(deadline, created);
+    meta.append(dates, rowWrapper);
+    li.append(titleRow, desc, meta);
+
+    Object.assign(row, { li, title, statusSelect, badge, desc, deadline, created, parentSelect, assigneeSelect });
+    return row;
+}
+
+function taskRowKey(task) {
+    // все, что видно в строке, кроме селектора родителя (у него свой ключ)
+    return [task.name, task.description, task.status, task.deadline, task.created_at, task.assigned_to_id].join("\u0000");
+}
+
+function parentOptionsKey(task) {
+    return `${task.parent_task_id}\u0000${tasksById.get(task.parent_task_id)?.name}`;
+}
+
+function updateTaskRow(row, task) {
+    const key = taskRowKey(task);
+    const parentKey = parentOptionsKey(task);
+    row.task = task;
+    if (key === row.key && parentKey === row.parentKey && row.membersVersion === membersVersion) return;
+    row.key = key;
+
+    row.title.textContent = task.name;
+    row.title.title = task.name;
+    row.desc.textContent = task.description || "Описание отсутствует";
+    row.desc.title = task.description || "";
+    row.deadline.textContent = `Дедлайн: ${formatDate(task.deadline)}`;
+    row.created.textContent = `Создана: ${formatDate(task.created_at)}`;
+
+    const canChangeStatus = currentUser && task.assigned_to_id === currentUser.id;
+    row.statusSelect.classList.toggle("d-none", !canChangeStatus);
+    row.badge.classList.toggle("d-none", canChangeStatus);
+    if (canChangeStatus) {
+        row.statusSelect.value = task.status;
+        applyStatusSelectStyle(row.statusSelect, task.status);
+    } else {
+        row.badge.className = `badge bg-${getStatusStyle(task.status).color}`;
+        row.badge.textContent = STATUS_LABELS[task.status] || task.status || "Статус";
+    }
+
+    if (row.parentKey !== parentKey) {
+        row.parentKey = parentKey;
+        delete row.parentSelect.dataset.full;
+        fillParentOptions(row.parentSelect, task);
+    }
+
+    if (row.membersVersion !== membersVersion) {
+        row.membersVersion = membersVersion;
+        fillAssigneeOptions(row.assigneeSelect);
+    }
+    row.assigneeSelect.value = task.assigned_to_id || "";
+    syncSelectTitle(row.parentSelect);
+    syncSelectTitle(row.assigneeSelect);
+}
+
+function renderVisibleTasks() {
+    if (!taskList) return;
+    const tasks = renderedTasks;
 
     if (!tasks.length) {
+        taskRows.clear();
+        taskList.innerHTML = "";
         const placeholder = document.createElement("li");
         placeholder.className = "list-group-item text-muted text-center";
         placeholder.textContent = "Задач пока нет.";
         taskList.append(placeholder);
         return;
     }
+    if (taskTopSpacer.parentNode !== taskList) {
+        taskList.innerHTML = "";
+        taskList.append(taskTopSpacer, taskBottomSpacer);
+    }
 
-    tasks.forEach(task => {
-        const li = document.createElement("li");
-        li.className = "list-group-item border-0 rounded-3 shadow-sm mb-2";
-
-        const titleRow = document.createElement("div");
-        titleRow.className = "d-flex justify-content-between align-items-center mb-1";
-
-        const title = document.createElement("h6");
-        title.className = "mb-0";
-        title.textContent = task.name;
-
-        const controls = document.createElement("div");
-        controls.className = "d-flex align-items-center gap-2";
-
-        const applyStatusSelectStyle = (selectEl, statusValue) => {
-            const { color, textClass } = getStatusStyle(statusValue);
-            selectEl.className = `form-select form-select-sm w-auto bg-${color} ${textClass}`;
-        };
-
-        const canChangeStatus = currentUser && task.assigned_to_id === currentUser.id;
-        let statusSelect;
-        if (canChangeStatus) {
-            statusSelect = document.createElement("select");
-            const options = [
-                { value: "New", label: STATUS_LABELS.New },
-                { value: "InProgress", label: STATUS_LABELS.InProgress },
-                { value: "UnderReview", label: STATUS_LABELS.UnderReview },
-                { value: "Completed", label: STATUS_LABELS.Completed }
-            ];
-            options.forEach(opt => {
-                const o = document.createElement("option");
-                o.value = opt.value;
-                o.textContent = opt.label;
-                if (opt.value === task.status) o.selected = true;
-                statusSelect.appendChild(o);
-            });
-            applyStatusSelectStyle(statusSelect, task.status);
-            statusSelect.addEventListener("change", async (e) => {
-                const newStatus = e.target.value;
-                try {
-                    await changeTaskStatus(task.id, newStatus);
-                    showProjectAlert("Статус задачи обновлен.", "success");
-                    await loadTasks();
-                } catch (err) {
-                    showProjectAlert(err.message || "Не удалось изменить статус задачи.");
-                    // вернуть предыдущее значение
-                    statusSelect.value = task.status;
-                } finally {
-                    applyStatusSelectStyle(statusSelect, statusSelect.value);
-                }
-            });
+    const viewport = taskList.clientHeight || window.innerHeight;
+    // после удаления задач scrollTop может оказаться ниже конца списка
+    const pageRows = Math.ceil(viewport / TASK_ROW_HEIGHT);
+    const start = Math.min(Math.floor(taskList.scrollTop / TASK_ROW_HEIGHT), Math.max(0, tasks.length - pageRows));
+    const first = Math.max(0, start - TASK_ROW_OVERSCAN);
+    const last = Math.min(tasks.length, start + pageRows + TASK_ROW_OVERSCAN);
+    const visible = tasks.slice(first, last);
+    const visibleIds = new Set(visible.map(t => t.id));
+
+    taskRows.forEach((row, id) => {
+        if (!visibleIds.has(id)) {
+            row.li.remove();
+            taskRows.delete(id);
         }
+    });
 
-        const delBtn = document.createElement("button");
-        delBtn.className = "btn btn-sm btn-outline-danger";
-        delBtn.textContent = "Удалить";
-        delBtn.addEventListener("click", async () => {
-            try {
-                await window.deleteTask(task.id);
-                showProjectAlert("Задача удалена.", "success");
-                await loadTasks();
-            } catch (err) {
-                showProjectAlert(err.message || "Не удалось удалить задачу.");
-            }
-        });
+    taskTopSpacer.style.height = `${first * TASK_ROW_HEIGHT}px`;
+    taskBottomSpacer.style.height = `${(tasks.length - last) * TASK_ROW_HEIGHT}px`;
 
-        if (statusSelect) {
-            controls.append(statusSelect, delBtn);
-        } else {
-            const badge = document.createElement("span");
-            const { color } = getStatusStyle(task.status);
-            badge.className = `badge bg-${color}`;
-            badge.textContent = STATUS_LABELS[task.status] || task.status || "Статус";
-            controls.append(badge, delBtn);
+    // строки переставляются только если порядок изменился
+    let anchor = taskTopSpacer;
+    visible.forEach(task => {
+        let row = taskRows.get(task.id);
+        if (!row) {
+            row = createTaskRow();
+            taskRows.set(task.id, row);
         }
-        titleRow.append(title, controls);
-
-        const desc = document.createElement("p");
-        desc.className = "mb-1 text-muted small";
-        desc.textContent = task.description || "Описание отсутствует";
-
-        const meta = document.createElement("div");
-        meta.className = "d-flex flex-wrap gap-3 text-secondary small";
-
-        const deadline = document.createElement("span");
-        deadline.textContent = `Дедлайн: ${formatDate(task.deadline)}`;
-
-        const created = document.createElement("span");
-        created.textContent = `Создана: ${formatDate(task.created_at)}`;
-
-        const parentSelect = document.createElement("select");
-        parentSelect.className = "form-select form-select-sm w-auto";
-        const noneOption = document.createElement("option");
-        noneOption.value = "";
-        noneOption.textContent = "Нет";
-        parentSelect.appendChild(noneOption);
-        loadedTasks
-            .filter(t => t.id !== task.id)
-            .forEach(t => {
-                const opt = document.createElement("option");
-                opt.value = t.id;
-                opt.textContent = t.name || t.id;
-                if (t.id === task.parent_task_id) opt.selected = true;
-                parentSelect.appendChild(opt);
-            });
-        parentSelect.addEventListener("change", async (e) => {
-            const newParentId = e.target.value || null;
-            try {
-                await updateTask(task.id, buildTaskUpdatePayload(task, newParentId));
-                showProjectAlert("Родительская задача обновлена.", "success");
-                await loadTasks();
-            } catch (err) {
-                showProjectAlert(err.message || "Не удалось обновить задачу.");
-                // откатить визуально
-                parentSelect.value = task.parent_task_id || "";
-            }
-        });
-
-        // Родитель и исполнитель в одной строке
-        const rowWrapper = document.createElement("div");
-        rowWrapper.className = "d-flex flex-wrap align-items-center gap-3";
-
-        const parentWrapper = document.createElement("div");
-        parentWrapper.className = "d-flex align-items-center gap-2";
-        const parentLabel = document.createElement("span");
-        parentLabel.textContent = "Родительская задача:";
-        parentLabel.className = "text-secondary";
-        parentWrapper.append(parentLabel, parentSelect);
-
-        // Исполнитель
-        const assigneeSelect = document.createElement("select");
-        assigneeSelect.className = "form-select form-select-sm w-auto";
-        const assigneeNone = document.createElement("option");
-        assigneeNone.value = "";
-        assigneeNone.textContent = "Не назначен";
-        assigneeSelect.appendChild(assigneeNone);
-        const assigneeList = projectOwnerAsMember ? [projectOwnerAsMember, ...loadedMembers] : loadedMembers;
-        assigneeList.forEach(m => {
-            const opt = document.createElement("option");
-            opt.value = m.user?.id || m.user_id;
-            opt.textContent = formatUserLabel(m.user, m.user_id);
-            if (opt.value === task.assigned_to_id) opt.selected = true;
-            assigneeSelect.appendChild(opt);
-        });
-        assigneeSelect.addEventListener("change", async (e) => {
-            const newAssigneeId = e.target.value || null;
-            try {
-                await updateTask(task.id, buildTaskUpdatePayload(task, task.parent_task_id, newAssigneeId));
-                showProjectAlert("Исполнитель задачи обновлен.", "success");
-                await loadTasks();
-            } catch (err) {
-                showProjectAlert(err.message || "Не удалось обновить исполнителя.");
-                assigneeSelect.value = task.assigned_to_id || "";
-            }
-        });
-
-        const assigneeWrapper = document.createElement("div");
-        assigneeWrapper.className = "d-flex align-items-center gap-2";
-        const assigneeLabel = document.createElement("span");
-        assigneeLabel.textContent = "Исполнитель:";
-        assigneeLabel.className = "text-secondary";
-        assigneeWrapper.append(assigneeLabel, assigneeSelect);
-
-        rowWrapper.append(parentWrapper, assigneeWrapper);
-
-        meta.append(deadline, created, rowWrapper);
+        updateTaskRow(row, task);
+        if (anchor.nextSibling !== row.li) {
+            taskList.insertBefore(row.li, anchor.nextSibling);
+        }
+        anchor = row.li;
+    });
+}
 
-        li.append(titleRow, desc, meta);
-        taskList.append(li);
+function scheduleVisibleTasks() {
+    if (taskListFrame !== null) return;
+    taskListFrame = requestAnimationFrame(() => {
+        taskListFrame = null;
+        renderVisibleTasks();
     });
 }
 
+function renderTasks(tasks) {
+    renderedTasks = tasks;
+    tasksById = new Map(tasks.map(t => [t.id, t]));
+    renderVisibleTasks();
+}
+
+taskList?.addEventListener("scroll", scheduleVisibleTasks, { passive: true });
+window.addEventListener("resize", scheduleVisibleTasks);
+
 function renderParticipants(members) {
     if (!participantsList) return;
 
@@ -515,13 +648,126 @@ async function loadParticipants() {
     try {
         const members = await fetchProjectMembers(projectId);
         loadedMembers = Array.isArray(members) ? members : [];
-        renderParticipants(loadedMembers);
-        updateAssigneeSelectOptions();
+        refreshParticipantViews();
     } catch (err) {
         showProjectAlert(err.message || "Не удалось загрузить участников.");
     }
 }
 
+function upsertTasks(tasks) {
+    // возвращает true, если пришло частичное обновление задачи, которой у нас нет
+    const byId = new Map(loadedTasks.map(t => [t.id, t]));
+    let missing = false;
+    tasks.forEach(change => {
+        const existing = byId.get(change.id);
+        if (existing) {
+            Object.assign(existing, change);
+        } else if (change.name !== undefined) {
+            loadedTasks.unshift(change);
+            byId.set(change.id, change);
+        } else {
+            missing = true;
+        }
+    });
+    return missing;
+}
+
+function removeTaskSubtrees(ids) {
+    const removed = new Set(ids);
+    let grew = true;
+    while (grew) {
+        grew = false;
+        loadedTasks.forEach(t => {
+            if (!removed.has(t.id) && removed.has(t.parent_task_id)) {
+                removed.add(t.id);
+                grew = true;
+            }
+        });
+    }
+    loadedTasks = loadedTasks.filter(t => !removed.has(t.id));
+}
+
+function refreshTaskViews(namesChanged = true) {
+    renderTasks(loadedTasks);
+    if (namesChanged) {
+        updateParentSelectOptions();
+    }
+}
+
+function refreshParticipantViews() {
+    renderParticipants(loadedMembers);
+    updateAssigneeSelectOptions();
+    // селекторы исполнителя в строках задач пересобираются при следующем патче
+    membersVersion += 1;
+    renderVisibleTasks();
+}
+
+function subscribeProjectEvents() {
+    const source = openProjectEvents(projectId);
+    if (!source) return;
+
+    const on = (type, handler) => source.addEventListener(type, event => handler(JSON.parse(event.data).data));
+    const resync = () => {
+        loadTasks();
+        loadParticipants();
+    };
+
+    on("task.created", data => {
+        upsertTasks(data.tasks);
+        refreshTaskViews();
+    });
+    on("task.updated", data => {
+        // смена статуса не трогает селектор родителя в форме, только свою строку
+        const renamed = data.tasks.some(change => change.name !== undefined && change.name !== tasksById.get(change.id)?.name);
+        if (upsertTasks(data.tasks)) {
+            loadTasks();
+            return;
+        }
+        refreshTaskViews(renamed);
+    });
+    on("task.deleted", data => {
+        removeTaskSubtrees(data.ids);
+        refreshTaskViews();
+    });
+    on("member.added", data => {
+        loadedMembers = loadedMembers.filter(m => m.id !== data.membership.id).concat(data.membership);
+        refreshParticipantViews();
+    });
+    on("member.updated", data => {
+        loadedMembers = loadedMembers.map(m => (m.id === data.membership.id ? data.membership : m));
+        refreshParticipantViews();
+    });
+    on("member.removed", data => {
+        loadedMembers = loadedMembers.filter(m => m.id !== data.id);
+        refreshParticipantViews();
+    });
+    on("project.updated", () => loadProject());
+    on("project.deleted", () => {
+        source.close();
+        showProjectAlert("Проект был удален.", "warning");
+        window.location.href = "projects.html";
+    });
+    on("resync", resync);
+    // сервер закрыл поток: участника удалили из проекта или истек токен
+    on("revoked", () => {
+        source.close();
+        showProjectAlert("Доступ к изменениям проекта закрыт. Обновите страницу.", "warning");
+    });
+
+    // после обрыва соединения часть событий могла потеряться
+    let dropped = false;
+    source.onerror = () => {
+        dropped = true;
+    };
+    source.onopen = () => {
+        if (dropped) {
+            dropped = false;
+            resync();
+        }
+    };
+    window.addEventListener("beforeunload", () => source.close());
+}
+
 function resetTaskForm() {
     taskForm?.reset();
     taskTitleInput?.classList.remove("is-invalid");
@@ -680,6 +926,7 @@ async function initProjectPage() {
         await loadProject();
         await loadTasks();
         await loadParticipants();
+        subscribeProjectEvents();
     } catch (err) {
         showProjectAlert(err.message || "Ошибка инициализации страницы.");
     }
@@ -0,0 +1,90 @@
+"""Benchmark GET /projects listing against the total number of projects.
+
+Seeds a throwaway SQLite database where one user belongs to a dozen
+projects among many others and times the membership-driven listing.
+
+    python scripts/bench_list_projects.py --sizes 1000 10000 50000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "bench.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import crud, models  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+
+
+def seed(total_projects: int, member_of: int = 12):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    me = models.User(email="me@example.com", hashed_password="x")
+    other = models.User(email="other@example.com", hashed_password="x")
+    db.add_all([me, other])
+    db.commit()
+
+    now = datetime.utcnow()
+    projects = [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"project {i}",
+            "owner_id": other.id,
+            "created_at": now - timedelta(seconds=i),
+        }
+        for i in range(total_projects)
+    ]
+    db.bulk_insert_mappings(models.Project, projects)
+    step = max(total_projects // member_of, 1)
+    db.bulk_insert_mappings(
+        models.ProjectMembership,
+        [{"project_id": p["id"], "user_id": me.id, "role": "member"} for p in projects[::step][:member_of]],
+    )
+    db.commit()
+    user_id = me.id
+    db.close()
+    return user_id
+
+
+def measure(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        db = SessionLocal()
+        start = time.perf_counter()
+        fn(db)
+        samples.append(time.perf_counter() - start)
+        db.close()
+    return statistics.median(samples) * 1000
+
+
+def legacy_listing(db, user_id):
+    return [p for p in crud.list_projects(db) if crud.can_access_project(db, p.id, user_id)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000, 50000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--legacy-max", type=int, default=5000, help="skip the per-project path above this size")
+    args = parser.parse_args()
+
+    print(f"{'projects':>10} {'keyset ms':>10} {'legacy ms':>10}")
+    for size in args.sizes:
+        user_id = seed(size)
+        keyset = measure(lambda db: crud.list_projects_for_user(db, user_id, limit=50), args.repeat)
+        legacy = "-"
+        if size <= args.legacy_max:
+            legacy = f"{measure(lambda db: legacy_listing(db, user_id), 3):.2f}"
+        print(f"{size:>10} {keyset:>10.2f} {legacy:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Fire a burst of concurrent logins while timing an unrelated read endpoint.
+
+bcrypt runs on the hashing process pool, so GET /projects latency should stay
+flat during the burst; logins beyond HASH_MAX_PENDING are refused with 503.
+
+    python scripts/bench_login_burst.py --logins 64 --reads 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from collections import Counter
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "bench.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+warnings.filterwarnings("ignore")
+
+import httpx  # noqa: E402
+
+from app import hashing  # noqa: E402
+from app.database import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+CREDENTIALS = {"email": "bench@example.com", "password": "secret"}
+
+
+async def timed_reads(client, headers, count):
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await client.get("/projects", headers=headers)
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.01)
+    return samples
+
+
+async def run(logins: int, reads: int):
+    Base.metadata.create_all(bind=engine)
+    hashing.hashing_pool.start()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/register", json=CREDENTIALS)
+        token = (await client.post("/login", json=CREDENTIALS)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        idle = await timed_reads(client, headers, reads)
+        burst = [client.post("/login", json=CREDENTIALS) for _ in range(logins)]
+        results = await asyncio.gather(timed_reads(client, headers, reads), *burst)
+        busy, responses = results[0], results[1:]
+
+    statuses = Counter(response.status_code for response in responses)
+    print(f"logins: {dict(statuses)}")
+    print(f"GET /projects idle  p50 {statistics.median(idle):7.1f} ms  max {max(idle):7.1f} ms")
+    print(f"GET /projects burst p50 {statistics.median(busy):7.1f} ms  max {max(busy):7.1f} ms")
+    print(f"hashing: {hashing.hashing_pool.stats()}")
+    hashing.hashing_pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--reads", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.reads))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark the reverse-scheduling engine on large synthetic task trees.
+
+Times ``compute_schedule`` on its own; with ``--db``, the full
+``ScheduleService.build`` path including loading the tasks from SQLite; and
+with ``--http``, GET /projects/{id}/schedule end to end, both cold (cache
+invalidated before every request) and from the cache, plus the body size.
+
+    python scripts/bench_schedule.py --sizes 10000 100000 --db --http
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+import warnings
+from datetime import datetime, timedelta
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "bench.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("OVERDUE_SWEEP_INTERVAL_SECONDS", "0")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+warnings.filterwarnings("ignore")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import models  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.schedule_service import (  # noqa: E402
+    ScheduleService, compute_schedule, schedule_service, to_epoch,
+)
+
+FINAL_DEADLINE = datetime(2030, 1, 1)
+
+
+def make_tree(size: int, seed: int = 7):
+    """Random tree: each task hangs under one of the previous ones, deadlines shrink with depth."""
+    rng = random.Random(seed)
+    created_at = datetime(2026, 1, 1)
+    tasks = []
+    depth_deadline = []
+    for index in range(size):
+        parent_index = rng.randrange(index) if index and rng.random() < 0.95 else None
+        parent_deadline = FINAL_DEADLINE if parent_index is None else depth_deadline[parent_index]
+        deadline = parent_deadline - timedelta(days=rng.randint(0, 20))
+        depth_deadline.append(deadline)
+        tasks.append({
+            "id": str(uuid.uuid4()),
+            "name": f"task {index}",
+            "parent_task_id": tasks[parent_index]["id"] if parent_index is not None else None,
+            "created_at": created_at,
+            "deadline": deadline,
+        })
+    return tasks
+
+
+def measure(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def seed(client: TestClient, tasks):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    client.post("/register", json={"email": "owner@example.com", "password": "secret"})
+    token = client.post("/login", json={"email": "owner@example.com", "password": "secret"}).json()["access_token"]
+    db = SessionLocal()
+    owner = db.query(models.User).filter_by(email="owner@example.com").one()
+    project = models.Project(name="bench", final_deadline=FINAL_DEADLINE, owner_id=owner.id)
+    db.add(project)
+    db.flush()
+    for task in tasks:
+        task["project_id"] = project.id
+    db.bulk_insert_mappings(models.Task, tasks)
+    db.commit()
+    return db, project, {"Authorization": f"Bearer {token}"}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db", action="store_true", help="also time loading the tasks from SQLite")
+    parser.add_argument("--http", action="store_true", help="also time GET /projects/{id}/schedule, cold and cached")
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    print(f"{'tasks':>8} {'engine ms':>10} {'db+engine ms':>13} {'http cold ms':>13} {'http cached ms':>15} {'body KiB':>9}")
+    for size in args.sizes:
+        tasks = make_tree(size)
+        rows = [
+            (t["id"], t["parent_task_id"], to_epoch(t["created_at"]), to_epoch(t["deadline"]))
+            for t in tasks
+        ]
+
+        def run_engine():
+            compute_schedule(to_epoch(FINAL_DEADLINE), rows)
+
+        engine_ms = measure(run_engine, args.repeat)
+
+        db_ms = cold_ms = cached_ms = body_kib = "-"
+        if args.db or args.http:
+            db, project, headers = seed(client, tasks)
+            if args.db:
+                service = ScheduleService()
+                db_ms = f"{measure(lambda: service.build(db, project), args.repeat):.1f}"
+            if args.http:
+                url = f"/projects/{project.id}/schedule"
+
+                def cold():
+                    schedule_service.invalidate(project.id)
+                    client.get(url, headers=headers)
+
+                cold_ms = f"{measure(cold, args.repeat):.1f}"
+                cached_ms = f"{measure(lambda: client.get(url, headers=headers), args.repeat):.1f}"
+                body_kib = f"{len(client.get(url, headers=headers).content) / 1024:.0f}"
+            db.close()
+        print(f"{size:>8} {engine_ms:>10.1f} {db_ms:>13} {cold_ms:>13} {cached_ms:>15} {body_kib:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Compare the old and new response pipelines for GET /projects/{id}/tasks.
+
+"orm" is the previous path: ORM objects with selectinload(assigned_to), validated
+through List[TaskRead] (orm_mode) and dumped by pydantic, as response_model does.
+"rows" is the current path: column rows -> dicts -> orjson via FastJSONResponse.
+Both bodies are checked for equality before timing.
+
+    python scripts/bench_serialization.py --sizes 1000 10000 100000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+import warnings
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+DB_PATH = Path(tempfile.mkdtemp()) / "bench.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+warnings.filterwarnings("ignore")
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from app import crud, models, schemas, serializers  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+
+TASKS = TypeAdapter(List[schemas.TaskRead])
+
+
+def seed(size: int):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    users = [models.User(email=f"u{i}@example.com", hashed_password="x", first_name=f"U{i}") for i in range(20)]
+    db.add_all(users)
+    project = models.Project(name="bench", final_deadline=datetime(2030, 1, 1))
+    db.add(project)
+    db.flush()
+    start = datetime(2026, 1, 1)
+    db.bulk_insert_mappings(models.Task, [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"task {i}",
+            "description": "lorem ipsum" if i % 3 else None,
+            "project_id": project.id,
+            "assigned_to_id": users[i % len(users)].id if i % 7 else None,
+            "created_at": start + timedelta(seconds=i),
+            "deadline": start + timedelta(days=i % 365, microseconds=i),
+        }
+        for i in range(size)
+    ])
+    db.commit()
+    project_id = project.id
+    db.close()
+    return project_id
+
+
+def orm_path(project_id: str):
+    db = SessionLocal()
+    tasks = crud.list_tasks_by_project(db, project_id)
+    body = TASKS.dump_json(TASKS.validate_python(tasks, from_attributes=True))
+    db.close()
+    return body
+
+
+def rows_path(project_id: str):
+    db = SessionLocal()
+    rows = crud.list_task_fields_by_project(db, project_id, crud.TASK_FIELDS)
+    body = serializers.FastJSONResponse(rows).body
+    db.close()
+    return body
+
+
+def measure(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'orm ms':>10} {'rows ms':>10} {'speedup':>8}")
+    for size in args.sizes:
+        project_id = seed(size)
+        if json.loads(orm_path(project_id)) != json.loads(rows_path(project_id)):
+            sys.exit(f"response bodies differ at {size} tasks")
+        orm_ms = measure(lambda: orm_path(project_id), args.repeat)
+        rows_ms = measure(lambda: rows_path(project_id), args.repeat)
+        print(f"{size:>8} {orm_ms:>10.1f} {rows_ms:>10.1f} {orm_ms / rows_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compare what the Gantt view transfers: the full task list vs one timeline window.
+
+Seeds a project whose tasks are spread over two years, then fetches
+GET /projects/{id}/tasks once and GET /projects/{id}/timeline for a few
+viewport widths, reporting body size and median latency through the app.
+
+    python scripts/bench_timeline.py --tasks 50000 --windows 7 30 90
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+import warnings
+from datetime import datetime, timedelta
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "bench.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("OVERDUE_SWEEP_INTERVAL_SECONDS", "0")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+warnings.filterwarnings("ignore")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import models  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+
+PLAN_START = datetime(2026, 1, 1)
+PLAN_DAYS = 730
+
+
+def seed(client: TestClient, size: int, seed: int = 7):
+    client.post("/register", json={"email": "owner@example.com", "password": "secret"})
+    token = client.post("/login", json={"email": "owner@example.com", "password": "secret"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    project_id = client.post(
+        "/projects", headers=headers, json={"name": "plan", "final_deadline": "2030-01-01T00:00:00"}
+    ).json()["id"]
+
+    rng = random.Random(seed)
+    db = SessionLocal()
+    users = [models.User(email=f"u{i}@example.com", hashed_password="x", first_name=f"U{i}") for i in range(20)]
+    db.add_all(users)
+    db.flush()
+    tasks = []
+    for index in range(size):
+        created_at = PLAN_START + timedelta(minutes=rng.randrange(PLAN_DAYS * 24 * 60))
+        tasks.append({
+            "id": str(uuid.uuid4()),
+            "name": f"task {index}",
+            "description": "lorem ipsum dolor sit amet" if index % 3 else None,
+            "project_id": project_id,
+            "parent_task_id": tasks[rng.randrange(index)]["id"] if index and rng.random() < 0.8 else None,
+            "assigned_to_id": users[index % len(users)].id if index % 7 else None,
+            "created_at": created_at,
+            "deadline": created_at + timedelta(days=rng.randint(1, 21)) if index % 10 else None,
+        })
+    db.bulk_insert_mappings(models.Task, tasks)
+    db.commit()
+    db.close()
+    return project_id, headers
+
+
+def measure(client: TestClient, url: str, headers: dict, repeat: int):
+    samples, size = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        samples.append(time.perf_counter() - start)
+        size = len(response.content)
+    return size, statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--windows", type=int, nargs="+", default=[7, 30, 90], help="viewport widths in days")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    project_id, headers = seed(client, args.tasks)
+    print(f"{'request':<28} {'tasks':>7} {'KiB':>10} {'median ms':>10}")
+
+    size, ms = measure(client, f"/projects/{project_id}/tasks", headers, args.repeat)
+    print(f"{'GET /tasks (all)':<28} {args.tasks:>7} {size / 1024:>10.1f} {ms:>10.1f}")
+    middle = PLAN_START + timedelta(days=PLAN_DAYS // 2)
+    for days in args.windows:
+        window = f"from={middle.isoformat()}&to={(middle + timedelta(days=days)).isoformat()}"
+        url = f"/projects/{project_id}/timeline?{window}"
+        count = len(client.get(url, headers=headers).json()["ids"])
+        size, ms = measure(client, url, headers, args.repeat)
+        print(f"{f'GET /timeline ({days} days)':<28} {count:>7} {size / 1024:>10.1f} {ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
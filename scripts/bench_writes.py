@@ -0,0 +1,106 @@
+"""Measure write throughput of the API on a file-backed SQLite database.
+
+Replays a fixed mix of write requests (create project, invite and accept,
+create/edit/status/delete tasks, comment, role change) through the ASGI app
+and reports requests per second plus the COMMITs and statements issued per
+request, so transaction-handling changes can be compared before and after.
+
+    python scripts/bench_writes.py --rounds 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "bench.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("OVERDUE_SWEEP_INTERVAL_SECONDS", "0")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+warnings.filterwarnings("ignore")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+counters = {"commits": 0, "statements": 0, "max_commits": 0}
+
+
+@event.listens_for(engine, "commit")
+def _commit(conn):
+    counters["commits"] += 1
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _statement(conn, cursor, statement, parameters, context, executemany):
+    if statement != "BEGIN":
+        counters["statements"] += 1
+
+
+def login(client, email):
+    client.post("/register", json={"email": email, "password": "secret"})
+    token = client.post("/login", json={"email": email, "password": "secret"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def write_round(client, round_no, owner, member, member_email):
+    """One round of writes; returns the number of requests issued."""
+    def send(method, url, headers, **kwargs):
+        commits = counters["commits"]
+        response = client.request(method, url, headers=headers, **kwargs)
+        counters["max_commits"] = max(counters["max_commits"], counters["commits"] - commits)
+        if response.status_code >= 400:
+            sys.exit(f"{method} {url} -> {response.status_code} {response.text}")
+        return response.json() if response.content else None
+
+    project = send("POST", "/projects", owner, json={"name": f"p{round_no}", "final_deadline": "2030-01-01T00:00:00"})
+    pid = project["id"]
+    invitation = send("POST", f"/projects/{pid}/invitations", owner, json={"invitee_email": member_email})
+    send("POST", f"/invitations/{invitation['id']}/accept", member)
+    send("PUT", f"/projects/{pid}", owner, json={"name": f"renamed {round_no}"})
+    tasks = [
+        send("POST", "/tasks", member, json={"name": f"t{index}", "project_id": pid, "deadline": "2029-01-01T00:00:00"})
+        for index in range(5)
+    ]
+    for task in tasks:
+        send("PATCH", f"/tasks/{task['id']}/status", member, json={"status": "InProgress"})
+        send("POST", "/comments", member, json={"text": "progress", "task_id": task["id"]})
+    send("PUT", f"/tasks/{tasks[0]['id']}", member, json={
+        "name": "edited", "project_id": pid, "assigned_to_id": tasks[0]["assigned_to_id"],
+    })
+    members = send("GET", f"/projects/{pid}/members", owner)
+    send("PATCH", f"/memberships/{members[0]['id']}/role", owner, json={"role": "leader"})
+    send("DELETE", f"/tasks/{tasks[-1]['id']}", owner)
+    return 4 + len(tasks) * 3 + 4
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    owner = login(client, "owner@example.com")
+    member_email = "member@example.com"
+    member = login(client, member_email)
+
+    requests = 0
+    counters.update(commits=0, statements=0, max_commits=0)
+    start = time.perf_counter()
+    for round_no in range(args.rounds):
+        requests += write_round(client, round_no, owner, member, member_email)
+    elapsed = time.perf_counter() - start
+
+    print(f"requests        {requests}")
+    print(f"requests/s      {requests / elapsed:.1f}")
+    print(f"commits/request {counters['commits'] / requests:.2f}")
+    print(f"max commits     {counters['max_commits']} (single request)")
+    print(f"stmts/request   {counters['statements'] / requests:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Check read-replica routing locally with two SQLite files.
+
+The replica is a copy of the primary taken with the sqlite3 backup API, so
+"replication" only happens when the script says so. After a rename by the
+owner, the owner's reads must see it (the X-Last-Write marker they send back
+keeps them on the primary) while another member still reads the stale
+replica until the sticky window ends. A user who has just registered must
+be able to use the token right away, before the replica has the account.
+
+    REPLICA_STICKY_SECONDS=1 python scripts/check_replica_routing.py
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+DB_DIR = Path(tempfile.mkdtemp())
+PRIMARY, REPLICA = DB_DIR / "primary.db", DB_DIR / "replica.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{PRIMARY}"
+os.environ["DATABASE_REPLICA_URLS"] = f"sqlite:///{REPLICA}"
+os.environ.setdefault("REPLICA_STICKY_SECONDS", "1")
+os.environ.setdefault("OVERDUE_SWEEP_INTERVAL_SECONDS", "0")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+warnings.filterwarnings("ignore")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import metrics  # noqa: E402
+from app.config import REPLICA_STICKY_SECONDS  # noqa: E402
+from app.database import replica_engines  # noqa: E402
+from app.main import app  # noqa: E402
+
+failures = []
+
+
+def replicate():
+    for replica_engine in replica_engines:
+        replica_engine.dispose()
+    with sqlite3.connect(PRIMARY) as source, sqlite3.connect(REPLICA) as target:
+        source.backup(target)
+
+
+class Client:
+    """Echoes X-Last-Write back like the frontend does (api.js keeps it in localStorage)."""
+
+    def __init__(self, client):
+        self.client = client
+        self.last_write = None
+
+    def request(self, method, url, headers=None, **kwargs):
+        headers = dict(headers or {})
+        if self.last_write:
+            headers["X-Last-Write"] = self.last_write
+        response = self.client.request(method, url, headers=headers, **kwargs)
+        self.last_write = response.headers.get("X-Last-Write", self.last_write)
+        return response
+
+
+def login(client, email):
+    client.request("POST", "/register", json={"email": email, "password": "secret"})
+    token = client.request("POST", "/login", json={"email": email, "password": "secret"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def expect(label, actual, expected):
+    print(f"{label:<48} {actual!r}" + ("" if actual == expected else f"  FAIL (expected {expected!r})"))
+    if actual != expected:
+        failures.append(label)
+
+
+def main():
+    test_client = TestClient(app)
+    # separate clients, as two browsers would be; each keeps its own marker
+    owner_client, member_client = Client(test_client), Client(test_client)
+    owner = login(owner_client, "owner@example.com")
+    member = login(member_client, "member@example.com")
+    project = owner_client.request(
+        "POST", "/projects", headers=owner, json={"name": "before", "final_deadline": "2030-01-01T00:00:00"}
+    )
+    pid = project.json()["id"]
+    invitation = owner_client.request(
+        "POST", f"/projects/{pid}/invitations", headers=owner, json={"invitee_email": "member@example.com"}
+    )
+    member_client.request("POST", f"/invitations/{invitation.json()['id']}/accept", headers=member)
+    replicate()
+    time.sleep(REPLICA_STICKY_SECONDS)
+
+    def name(client, headers):
+        return client.request("GET", f"/projects/{pid}", headers=headers).json()["name"]
+
+    expect("member reads replica", name(member_client, member), "before")
+    owner_client.request("PUT", f"/projects/{pid}", headers=owner, json={"name": "after"})
+    expect("owner reads own write (primary)", name(owner_client, owner), "after")
+    expect("member still reads replica (lagging)", name(member_client, member), "before")
+    time.sleep(REPLICA_STICKY_SECONDS)
+    expect("owner back on replica after sticky window", name(owner_client, owner), "before")
+    replicate()
+    expect("member after replication", name(member_client, member), "after")
+
+    newcomer_client = Client(test_client)
+    newcomer = login(newcomer_client, "newcomer@example.com")
+    # without the marker the read lands on the replica, which has no such user yet
+    expect("new user's GET without the marker", test_client.get("/users/me", headers=newcomer).status_code, 401)
+    expect("new user's GET with the marker", newcomer_client.request("GET", "/users/me", headers=newcomer).status_code, 200)
+
+    print(metrics.snapshot()["db_replicas"])
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
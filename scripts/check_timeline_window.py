@@ -0,0 +1,76 @@
+"""Check which tasks GET /projects/{id}/timeline returns for a date window.
+
+Seeds tasks covering every arrangement of created_at, deadline and the window,
+including tasks created with a deadline already in the past, then compares
+``crud.get_task_timeline`` with a plain overlap test of the span
+``[min(created_at, deadline), max(created_at, deadline)]`` against the window.
+
+    python scripts/check_timeline_window.py
+"""
+import os
+import sys
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from itertools import product
+from pathlib import Path
+
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'timeline.db'}"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import crud, models  # noqa: E402
+from app.database import SessionLocal, init_db  # noqa: E402
+
+BASE = datetime(2020, 1, 1)
+# day offsets before, at the edges of, inside and after the windows below
+DAYS = (-40, -31, -30, -10, 0, 10, 30, 31, 40)
+WINDOWS = (
+    (BASE - timedelta(days=31), BASE + timedelta(days=31)),  # 2019-12-01 .. 2020-02-01
+    (BASE - timedelta(days=30), BASE - timedelta(days=30)),  # a single instant
+    (BASE + timedelta(days=11), BASE + timedelta(days=29)),
+)
+
+
+def expected(task, window_start, window_end):
+    created_at, deadline = task["created_at"], task["deadline"]
+    if deadline is None:
+        return window_start <= created_at <= window_end
+    return min(created_at, deadline) <= window_end and max(created_at, deadline) >= window_start
+
+
+def main():
+    init_db()
+    db = SessionLocal()
+    project = models.Project(name="timeline", final_deadline=datetime(2030, 1, 1))
+    db.add(project)
+    db.flush()
+    tasks = [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"created {created:+} deadline {deadline}",
+            "project_id": project.id,
+            "created_at": BASE + timedelta(days=created),
+            "deadline": None if deadline is None else BASE + timedelta(days=deadline),
+        }
+        for created, deadline in product(DAYS, DAYS + (None,))
+    ]
+    db.bulk_insert_mappings(models.Task, tasks)
+    db.commit()
+
+    failures = 0
+    for window_start, window_end in WINDOWS:
+        returned = set(crud.get_task_timeline(db, project.id, window_start, window_end)["ids"])
+        wanted = {task["id"] for task in tasks if expected(task, window_start, window_end)}
+        for task in tasks:
+            if (task["id"] in returned) != (task["id"] in wanted):
+                failures += 1
+                state = "returned" if task["id"] in returned else "missing"
+                print(f"{window_start:%Y-%m-%d}..{window_end:%Y-%m-%d}: {task['name']} {state}")
+        print(f"{window_start:%Y-%m-%d}..{window_end:%Y-%m-%d}: {len(returned)} of {len(tasks)} tasks")
+    db.close()
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Report how many SQL statements each endpoint issues.
+
+Runs a scripted session against a throwaway SQLite database and counts
+statements per request. Exits non-zero when an endpoint goes over its
+budget, so it can guard against query-count regressions.
+
+    python scripts/count_queries.py [-v]
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "queries.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+statements = []
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count(conn, cursor, statement, parameters, context, executemany):
+    # the explicit BEGIN on SQLite (app.database.use_sqlite_begin) is implicit in other drivers
+    if statement != "BEGIN":
+        statements.append(statement)
+
+
+client = TestClient(app)
+results = []
+
+
+def call(label, budget, method, url, headers=None, **kwargs):
+    statements.clear()
+    response = client.request(method, url, headers=headers, **kwargs)
+    assert response.status_code < 400, (label, response.status_code, response.text)
+    results.append((label, list(statements), budget))
+    return response.json() if response.content else None
+
+
+def login(email):
+    client.post("/register", json={"email": email, "password": "secret"})
+    token = client.post("/login", json={"email": email, "password": "secret"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def main():
+    verbose = "-v" in sys.argv[1:]
+    owner = login("owner@example.com")
+    member = login("member@example.com")
+    for index in range(3):
+        login(f"team{index}@example.com")
+
+    project = call("POST /projects", 3, "POST", "/projects", owner, json={"name": "p", "final_deadline": "2030-01-01T00:00:00"})
+    pid = project["id"]
+    invitation = call(
+        "POST /projects/{id}/invitations", 7, "POST", f"/projects/{pid}/invitations", owner,
+        json={"invitee_email": "member@example.com"},
+    )
+    call("GET /invitations", 2, "GET", "/invitations", member)
+    call(
+        "POST /projects/{id}/invitations/bulk", 6, "POST", f"/projects/{pid}/invitations/bulk", owner,
+        json={"invitations": [{"invitee_email": f"team{index}@example.com"} for index in range(3)]
+              + [{"invitee_email": "member@example.com"}, {"invitee_email": "nobody@example.com"}]},
+    )
+    call("POST /invitations/{id}/accept", 8, "POST", f"/invitations/{invitation['id']}/accept", member)
+    call("GET /projects", 1, "GET", "/projects", owner)
+    call("GET /projects/{id}", 1, "GET", f"/projects/{pid}", owner)
+    call("PUT /projects/{id}", 3, "PUT", f"/projects/{pid}", owner, json={"name": "renamed"})
+    task = call(
+        "POST /tasks", 5, "POST", "/tasks", member,
+        json={"name": "t", "project_id": pid, "deadline": "2029-01-01T00:00:00"},
+    )
+    call(
+        "PUT /tasks/{id}", 5, "PUT", f"/tasks/{task['id']}", owner,
+        json={"name": "t2", "project_id": pid, "deadline": "2029-01-01T00:00:00", "assigned_to_id": task["assigned_to_id"]},
+    )
+    call("PATCH /tasks/{id}/status", 6, "PATCH", f"/tasks/{task['id']}/status", owner, json={"status": "InProgress"})
+    call("POST /comments", 5, "POST", "/comments", owner, json={"text": "c", "task_id": task["id"]})
+    call("GET /tasks/{id}/comments", 3, "GET", f"/tasks/{task['id']}/comments", owner)
+    call("GET /search", 1, "GET", "/search?q=t", owner)
+    call("GET /projects/{id}/tasks", 2, "GET", f"/projects/{pid}/tasks", owner)
+    call("GET /projects/{id}/summary", 4, "GET", f"/projects/{pid}/summary", owner)
+    call(
+        "GET /projects/{id}/timeline", 3, "GET",
+        f"/projects/{pid}/timeline?from=2020-01-01T00:00:00&to=2030-01-01T00:00:00", owner,
+    )
+    listing = client.get(f"/projects/{pid}/tasks", headers=owner)
+    call("GET /projects/{id}/tasks (304)", 1, "GET", f"/projects/{pid}/tasks", {**owner, "If-None-Match": listing.headers["ETag"]})
+    since = int(listing.headers["X-Sync-Cursor"]) - 1
+    call("GET /projects/{id}/tasks?since=", 3, "GET", f"/projects/{pid}/tasks?since={since}", owner)
+    members = call("GET /projects/{id}/members", 2, "GET", f"/projects/{pid}/members", owner)
+    call("GET /projects/{id}/invitations", 2, "GET", f"/projects/{pid}/invitations", owner)
+    call("PATCH /memberships/{id}/role", 5, "PATCH", f"/memberships/{members[0]['id']}/role", owner, json={"role": "leader"})
+    call("DELETE /memberships/{id}", 4, "DELETE", f"/memberships/{members[0]['id']}", owner)
+    call("DELETE /tasks/{id}", 8, "DELETE", f"/tasks/{task['id']}", owner)
+    call("DELETE /projects/{id}", 8, "DELETE", f"/projects/{pid}", owner)
+
+    failed = False
+    print(f"{'endpoint':<38} {'statements':>10} {'budget':>7}")
+    for label, issued, budget in results:
+        marker = "" if len(issued) <= budget else "  OVER BUDGET"
+        failed = failed or len(issued) > budget
+        print(f"{label:<38} {len(issued):>10} {budget:>7}{marker}")
+        if verbose:
+            for statement in issued:
+                print("    " + " ".join(statement.split())[:110])
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
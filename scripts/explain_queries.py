@@ -0,0 +1,133 @@
+"""Capture EXPLAIN plans for the queries issued by ``app.crud``.
+
+Seeds sample rows inside a transaction that is rolled back at the end, calls
+each crud lookup, and prints the plan of every statement it issued
+(``EXPLAIN`` on Postgres, ``EXPLAIN QUERY PLAN`` on SQLite). Points at
+DATABASE_URL, so run it against a migrated staging copy to check the plans
+that production will get.
+
+    DATABASE_URL=postgresql://... python scripts/explain_queries.py --projects 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'explain.db'}"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app import crud, models  # noqa: E402
+from app.database import engine, init_db  # noqa: E402
+from app.services.search_service import search_service  # noqa: E402
+
+
+def seed(db: Session, project_count: int, tasks_per_project: int):
+    users = [{"id": str(uuid.uuid4()), "email": f"user{i}@example.com", "hashed_password": "x"} for i in range(50)]
+    db.bulk_insert_mappings(models.User, users)
+    projects, memberships, tasks, comments, invitations = [], [], [], [], []
+    for i in range(project_count):
+        owner = users[i % len(users)]["id"]
+        member = users[(i + 1) % len(users)]["id"]
+        project_id = str(uuid.uuid4())
+        projects.append({"id": project_id, "name": f"project {i}", "owner_id": owner})
+        memberships.append({"id": str(uuid.uuid4()), "project_id": project_id, "user_id": member, "role": "member"})
+        invitations.append({
+            "id": str(uuid.uuid4()), "project_id": project_id, "inviter_id": owner,
+            "invitee_id": users[(i + 2) % len(users)]["id"], "role": "member",
+            "status": models.InvitationStatusEnum.Pending,
+        })
+        parent_id = None
+        for j in range(tasks_per_project):
+            task_id = str(uuid.uuid4())
+            tasks.append({
+                "id": task_id, "name": f"task {j}", "project_id": project_id,
+                "parent_task_id": parent_id, "assigned_to_id": member,
+                "deadline": datetime(2020, 1, 1) + timedelta(days=i + j) if j % 4 == 0 else None,
+            })
+            comments.append({"id": str(uuid.uuid4()), "text": "note", "task_id": task_id, "author_id": member})
+            parent_id = task_id if j % 5 else None
+    for mapper, rows in (
+        (models.Project, projects), (models.ProjectMembership, memberships),
+        (models.ProjectInvitation, invitations), (models.Task, tasks), (models.Comment, comments),
+    ):
+        db.bulk_insert_mappings(mapper, rows)
+    db.flush()
+    return {
+        "user_id": users[1]["id"],
+        "invitee_id": users[2]["id"],
+        "project_id": projects[0]["id"],
+        "task_id": tasks[0]["id"],
+        "email": users[3]["email"],
+    }
+
+
+def crud_lookups(ids):
+    return [
+        ("get_user_by_email", lambda db: crud.get_user_by_email(db, ids["email"])),
+        ("list_projects_for_user", lambda db: crud.list_projects_for_user(db, ids["user_id"], limit=50)),
+        ("get_project_access", lambda db: crud.get_project_access(db, ids["project_id"], ids["user_id"])),
+        ("get_membership", lambda db: crud.get_membership(db, ids["project_id"], ids["user_id"])),
+        ("list_members_by_project", lambda db: crud.list_members_by_project(db, ids["project_id"])),
+        ("list_tasks_by_project", lambda db: crud.list_tasks_by_project(db, ids["project_id"])),
+        ("get_invitation_by_project_and_invitee",
+         lambda db: crud.get_invitation_by_project_and_invitee(db, ids["project_id"], ids["invitee_id"])),
+        ("list_invitations_by_invitee", lambda db: crud.list_invitations_by_invitee(db, ids["invitee_id"])),
+        ("list_invitations_by_project", lambda db: crud.list_invitations_by_project(db, ids["project_id"])),
+        ("task comments", lambda db: crud.get_task(db, ids["task_id"]).comments),
+        ("list_comments", lambda db: crud.list_comments(db, ids["task_id"], 50, after=(datetime(2020, 1, 1), ""))),
+        ("list_task_changes", lambda db: crud.list_task_changes(db, ids["project_id"], 0, crud.TASK_FIELDS)),
+        ("get_task_summary", lambda db: crud.get_task_summary(
+            db, ids["project_id"], datetime(2020, 1, 6), datetime(2020, 1, 13))),
+        ("get_task_timeline", lambda db: crud.get_task_timeline(
+            db, ids["project_id"], datetime(2020, 1, 1), datetime(2020, 3, 1))),
+        ("search", lambda db: search_service.search(db, ids["user_id"], "task 1", 20)),
+        ("mark_overdue_tasks", lambda db: crud.mark_overdue_tasks(db, datetime(2021, 1, 1), 100)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--tasks-per-project", type=int, default=20)
+    args = parser.parse_args()
+
+    init_db()
+    explain_prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    with engine.connect() as connection:
+        outer = connection.begin()
+        db = Session(bind=connection, join_transaction_mode="create_savepoint")
+        ids = seed(db, args.projects, args.tasks_per_project)
+        if engine.dialect.name == "postgresql":
+            connection.exec_driver_sql("ANALYZE")
+
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(("SELECT", "UPDATE")):
+                captured.append((statement, parameters))
+
+        for label, lookup in crud_lookups(ids):
+            db.expunge_all()
+            captured.clear()
+            event.listen(connection, "before_cursor_execute", capture)
+            lookup(db)
+            event.remove(connection, "before_cursor_execute", capture)
+            for statement, parameters in captured:
+                print(f"== {label}")
+                print("   " + " ".join(statement.split()))
+                for row in connection.exec_driver_sql(explain_prefix + statement, parameters):
+                    print("   -> " + " | ".join(str(column) for column in row))
+            print()
+        db.close()
+        outer.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Check or rebuild the SQLite FTS5 search indexes behind GET /search.
+
+The FTS5 tables point at task and comment rows by rowid, which SQLite may
+renumber on VACUUM or when a migration rebuilds the table; run this
+afterwards. On Postgres the tsvector columns are generated by the database
+and never drift, so there is nothing to do. Points at DATABASE_URL.
+
+    DATABASE_URL=sqlite:///./app.db python scripts/rebuild_search_index.py [--check]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy.exc import DatabaseError  # noqa: E402
+
+from app.database import engine  # noqa: E402
+
+FTS_TABLES = ("tasks_fts", "comments_fts")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true", help="only verify the indexes against their tables")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "sqlite":
+        print(f"{engine.dialect.name}: search vectors are generated columns, nothing to rebuild")
+        return
+
+    broken = []
+    with engine.begin() as connection:
+        for fts in FTS_TABLES:
+            try:
+                # rank=1 also compares the index with the content table, not just its own structure
+                connection.exec_driver_sql(f"INSERT INTO {fts}({fts}, rank) VALUES ('integrity-check', 1)")
+            except DatabaseError:
+                broken.append(fts)
+            if not args.check:
+                connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    for fts in broken:
+        print(f"{fts}: out of sync" + (" (not fixed)" if args.check else ", rebuilt"))
+    print(f"{len(broken)} of {len(FTS_TABLES)} indexes out of sync")
+    if args.check and broken:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
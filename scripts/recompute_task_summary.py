@@ -0,0 +1,56 @@
+"""Check the incrementally maintained project task summaries against the tasks table.
+
+Prints every (project, status, assignee) count that drifted, then rebuilds
+the summaries with one GROUP BY unless --check is given (exits non-zero on
+drift in that case). Points at DATABASE_URL.
+
+    DATABASE_URL=postgresql://... python scripts/recompute_task_summary.py [--project ID] [--check]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import select  # noqa: E402
+
+from app import crud, models  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.unit_of_work import unit_of_work  # noqa: E402
+
+
+def stored_counts(db, project_id):
+    summary = models.ProjectTaskSummary
+    stmt = select(summary.project_id, summary.status, summary.assignee_id, summary.task_count)
+    if project_id:
+        stmt = stmt.where(summary.project_id == project_id)
+    return as_dict(db.execute(stmt))
+
+
+def as_dict(rows):
+    return {(project_id, status, assignee_id): count for project_id, status, assignee_id, count in rows if count}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project")
+    parser.add_argument("--check", action="store_true", help="only report drift")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        before = stored_counts(db, args.project)
+        after = as_dict(db.execute(crud.task_summary_counts(args.project)))
+        drift = sorted(key for key in before.keys() | after.keys() if before.get(key) != after.get(key))
+        for project_id, status, assignee_id in drift:
+            key = (project_id, status, assignee_id)
+            print(f"{project_id} {status.value:<12} {assignee_id or '-':<36} {before.get(key, 0):>6} -> {after.get(key, 0)}")
+        if drift and not args.check:
+            with unit_of_work(db):
+                crud.recompute_task_summary(db, args.project)
+        print(f"{len(drift)} drifted rows" + (" (not fixed)" if args.check and drift else ""))
+    if args.check and drift:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()